@@ -1,84 +1,170 @@
 import os
+import csv
+import gzip
+import zlib
+import time
+import queue
+import atexit
+import threading
 import logging
-from datetime import datetime
-from flask import Flask, render_template, request, flash, redirect, url_for, session, jsonify, make_response, g, send_from_directory
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from flask import Flask, render_template, request, flash, redirect, url_for, session, jsonify, make_response, Response, stream_with_context, g, send_from_directory, abort
+from markupsafe import Markup, escape
 from slugify import slugify
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
-from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
-from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from flask_sqlalchemy.pagination import SelectPagination
+from sqlalchemy import bindparam, func, distinct, select, insert, update, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.pool import NullPool
+from flask_login import LoginManager, login_user, logout_user, current_user
 from flask_mail import Mail
 from werkzeug.utils import secure_filename
 import uuid
+import shutil
 import hashlib
 import re
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 
-# DEBUG MODE FLAG - Set to False to re-enable authentication
+# DEBUG MODE FLAG - Set to False to re-enable authentication (checked by require_admin_login)
 DEBUG_MODE = False
 
-# Create a bypass for the login_required decorator when DEBUG_MODE is True
-if DEBUG_MODE:
-    # Store the original decorator for future use
-    original_login_required = login_required
-    
-    # Create a dummy decorator that allows access without login
-    def login_required(func):
-        # This is a bypass decorator that simply returns the original function
-        return func
-# Note: Authentication is now reinstated - all @login_required decorators will function normally
-
 # Configure logging - use INFO level in production for better performance
 log_level = logging.INFO if os.environ.get('FLASK_ENV') == 'production' else logging.DEBUG
-logging.basicConfig(
-    level=log_level,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
+log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+log_datefmt = '%Y-%m-%d %H:%M:%S'
+if os.environ.get('FLASK_ENV') == 'production':
+    # Request threads only enqueue records; a listener thread does the stderr writes
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(log_format, log_datefmt))
+    log_listener = QueueListener(log_queue, stream_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    logging.basicConfig(level=log_level, format='%(message)s', handlers=[QueueHandler(log_queue)])
+else:
+    logging.basicConfig(level=log_level, format=log_format, datefmt=log_datefmt)
+
+# SQLAlchemy instance lives in extensions so models don't have to import app
+from extensions import db
+from models import (
+    Admin, BlogPost, ButtonClick, ClassSession, Contact, EmailLog, InfoSession,
+    InfoSessionBooking, InfoSessionEmail, PageView, ReferralSource, SessionDuration,
+    SiteSetting, VisitorLocation
+)
+from utils.email import (
+    send_booking_confirmation_email, send_contact_notification, send_email, send_zoom_link_email
 )
 
-# Define the base class for SQLAlchemy models
-class Base(DeclarativeBase):
-    pass
+# Static file cache lifetimes by extension: 30 days for CSS/JS, 90 days for images
+STATIC_MAX_AGE = {'css': 2592000, 'js': 2592000}
+STATIC_MAX_AGE.update(dict.fromkeys(('jpg', 'jpeg', 'png', 'gif', 'ico', 'svg'), 7776000))
+STATIC_DEFAULT_MAX_AGE = 86400  # 1 day for other static files
 
-# Create SQLAlchemy instance
-db = SQLAlchemy(model_class=Base)
+class FactsFlask(Flask):
+    """Flask application that picks static file cache lifetimes by extension"""
+    
+    def get_send_file_max_age(self, filename):
+        # Only the static endpoint gets long lifetimes; other send_file calls keep the default
+        if filename is None or request.endpoint != 'static':
+            return super().get_send_file_max_age(filename)
+        return STATIC_MAX_AGE.get(filename.rpartition('.')[2], STATIC_DEFAULT_MAX_AGE)
 
 # Create Flask application
-app = Flask(__name__)
+app = FactsFlask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev_secret_key")
 
+# Serialize JSON responses with orjson when it is installed
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that encodes with orjson and falls back to Flask for anything else"""
+        # Dates are passed through so they keep Flask's HTTP date format
+        OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+        def dumps(self, obj, **kwargs):
+            if kwargs:
+                return super().dumps(obj, **kwargs)
+            return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(
+                orjson.dumps(obj, default=self.default, option=self.OPTIONS),
+                mimetype=self.mimetype
+            )
+
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
+except ImportError:
+    app.logger.warning("orjson not installed, using the default JSON provider")
+
 # Initialize Flask-Mail
 mail = Mail()
 
+# Cookie settings shared by every environment
+app.config.update(
+    SESSION_COOKIE_HTTPONLY=True,
+    SESSION_COOKIE_SAMESITE='Lax',
+    SESSION_REFRESH_EACH_REQUEST=False,  # Only send Set-Cookie when the session changes
+    REMEMBER_COOKIE_HTTPONLY=True,
+    REMEMBER_COOKIE_SAMESITE='Lax',
+    REMEMBER_COOKIE_DURATION=timedelta(days=30)
+)
+
 # Configure production settings
 if os.environ.get('FLASK_ENV') == 'production':
     # Production settings
     app.config.update(
         SESSION_COOKIE_SECURE=True,
-        SESSION_COOKIE_HTTPONLY=True,
-        SESSION_COOKIE_SAMESITE='Lax',
+        REMEMBER_COOKIE_SECURE=True,
         PREFERRED_URL_SCHEME='https'
     )
-    
-    # Compression for responses (where supported)
-    from flask_compress import Compress
-    compress = Compress()
-    compress.init_app(app)
+
+# Compression for responses in every environment, so local testing sees the same headers as production;
+# prefer brotli and skip replies too small to benefit
+app.config.update(
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_LEVEL=6,
+    COMPRESS_MIN_SIZE=500,
+    COMPRESS_MIMETYPES=['text/html', 'text/css', 'application/javascript', 'application/json', 'image/svg+xml']
+)
+from flask_compress import Compress
+compress = Compress()
+compress.init_app(app)
 
 # Configure the database
 database_url = os.environ.get("DATABASE_URL")
 app.logger.info(f"Using database URL: {database_url}")
 app.config["SQLALCHEMY_DATABASE_URI"] = database_url
-app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-    "pool_recycle": 300,
-    "pool_pre_ping": True,
-    "pool_size": 10,  # Limit max connections
-    "max_overflow": 15,  # Allow temporary additional connections
-    "pool_timeout": 30,  # Connection timeout
-}
+if os.environ.get('DB_USE_PGBOUNCER') == '1':
+    # PgBouncer already pools server connections; holding a second pool per worker only pins them
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"poolclass": NullPool}
+else:
+    # Pools are per worker process: keep workers x (pool_size + max_overflow) below Postgres max_connections
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_recycle": int(os.environ.get('DB_POOL_RECYCLE', 300)),
+        # pre_ping costs a SELECT 1 per checkout but survives connections dropped by the database or network;
+        # set DB_POOL_PRE_PING=0 on stable infrastructure and lower DB_POOL_RECYCLE instead
+        "pool_pre_ping": os.environ.get('DB_POOL_PRE_PING', '1') == '1',
+        # At most 13 threads per worker hold a connection at once (8 gthread request threads, the analytics
+        # writer, background_executor's 4), so 10 + 15 overflow never makes them queue
+        "pool_size": int(os.environ.get('DB_POOL_SIZE', 10)),
+        "max_overflow": int(os.environ.get('DB_MAX_OVERFLOW', 15)),  # Allow temporary additional connections
+        # Fail fast under overload instead of piling up request threads behind the pool
+        "pool_timeout": int(os.environ.get('DB_POOL_TIMEOUT', 5)),
+        "pool_use_lifo": True,  # Reuse the most recent connection so idle ones can be recycled
+    }
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False  # Reduces overhead
 
 # Configure Flask-Mail for sending emails
@@ -101,11 +187,47 @@ app.config['TESTING_EMAIL_ENABLED'] = (os.environ.get('FLASK_ENV') != 'productio
 # File upload configuration
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['UPLOAD_FOLDER'] = 'static'
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'mp4', 'webm', 'ogg', 'avi', 'mov'}
+ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'mp4', 'webm', 'ogg', 'avi', 'mov'})
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Copy uploads in 1MB chunks
+
+# Background pool for work that shouldn't hold up the request thread
+background_executor = ThreadPoolExecutor(max_workers=4)
 
 def allowed_file(filename):
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in ALLOWED_EXTENSIONS
+
+def _fsync_path(path):
+    """Flush a saved file to disk"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        app.logger.warning(f"Error syncing {path} to disk: {str(e)}")
+
+def save_upload(file_storage, upload_dir, filename):
+    """Stream an uploaded file into upload_dir and return the saved path"""
+    os.makedirs(upload_dir, exist_ok=True)
+    file_path = os.path.join(upload_dir, filename)
+    
+    # Write to a temporary name first so a half-written file is never served
+    tmp_path = os.path.join(upload_dir, f".tmp-{uuid.uuid4().hex}")
+    try:
+        with open(tmp_path, 'wb') as fh:
+            shutil.copyfileobj(file_storage.stream, fh, UPLOAD_CHUNK_SIZE)
+        os.replace(tmp_path, file_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    # Durability flush happens off the request thread
+    background_executor.submit(_fsync_path, file_path)
+    return file_path
 
 # Initialize the app with the extensions
 db.init_app(app)
@@ -120,21 +242,104 @@ login_manager.login_message_category = 'info'
 
 @login_manager.user_loader
 def load_user(user_id):
-    from models import Admin
-    return Admin.query.get(int(user_id))
+    return db.session.get(Admin, int(user_id))
+
+def insert_or_ignore(model, index_elements):
+    """INSERT ... ON CONFLICT DO NOTHING for the configured database (Postgres in production, SQLite locally)"""
+    dialect_insert = sqlite.insert if db.engine.dialect.name == 'sqlite' else postgresql.insert
+    return dialect_insert(model).on_conflict_do_nothing(index_elements=index_elements)
+
+CSV_CHUNK_SIZE = 65536  # Rows are sent in ~64 KiB blocks rather than one socket write/TLS record each
+
+class _CSVLine:
+    """Write target for csv.writer that returns each formatted line instead of storing it"""
+    def write(self, line):
+        return line
+
+_CSV_SPECIAL_RE = re.compile(r'[",\r\n]')
+# Spreadsheets run cells starting with these as formulas
+_CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def csv_escape_formula(value):
+    """Prefix free text that a spreadsheet would treat as a formula with a ' so it opens as plain text
+
+    Only for free-text columns such as notes and comments; phone numbers and other
+    structured values starting with + or - are exported as they are.
+    """
+    if value and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def csv_field(value):
+    """Quote a text field only when it needs it, matching csv.writer's default QUOTE_MINIMAL output"""
+    if _CSV_SPECIAL_RE.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def stream_csv(filename, header, rows, preformatted=False):
+    """Stream rows as a CSV download instead of building the whole file in memory
+
+    With preformatted=True each row is already a CSV line (built with csv_field) and is sent as is.
+    """
+    # writerow() returns whatever write() returns, so each call hands back its formatted line
+    writer = csv.writer(_CSVLine())
+
+    def generate():
+        lines = [writer.writerow(header)]
+        size = 0
+        for row in rows:
+            line = row if preformatted else writer.writerow(row)
+            lines.append(line)
+            size += len(line)
+            if size >= CSV_CHUNK_SIZE:
+                yield ''.join(lines)
+                lines.clear()
+                size = 0
+        yield ''.join(lines)
+
+    def generate_gzip():
+        # Level 1 keeps CPU low; CSV text still shrinks several times over
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+        for chunk in generate():
+            data = compressor.compress(chunk.encode('utf-8'))
+            if data:
+                yield data
+        yield compressor.flush()
+
+    headers = {'Content-Disposition': f'attachment; filename={filename}', 'Vary': 'Accept-Encoding'}
+    # Compressed here, chunk by chunk: flask_compress would buffer the whole stream first
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        headers['Content-Encoding'] = 'gzip'
+        body = generate_gzip()
+    else:
+        body = generate()
+
+    return Response(stream_with_context(body), mimetype='text/csv', headers=headers)
+
+SITE_SETTINGS_TTL = 60  # Seconds a worker reuses its settings snapshot; saves in this worker clear it at once
+_site_settings = {'expires': 0, 'value': None}
+
+def load_site_settings():
+    """Return a {key: parsed_value} snapshot of all site settings, shared across requests for a short TTL"""
+    now = time.time()
+    if _site_settings['value'] is None or now >= _site_settings['expires']:
+        # Stream plain (key, value, type) rows rather than hydrating ORM objects
+        rows = db.session.query(SiteSetting.key, SiteSetting.value, SiteSetting.value_type).yield_per(500)
+        _site_settings['value'] = {key: SiteSetting.parse_value(value, value_type) for key, value, value_type in rows}
+        _site_settings['expires'] = now + SITE_SETTINGS_TTL
+    return _site_settings['value']
+
+def clear_site_settings():
+    """Drop the cached settings snapshot and the pages rendered from it after settings change"""
+    _site_settings['value'] = None
+    clear_rendered_pages()
 
 # Global template function to load site settings
 @app.context_processor
 def inject_site_settings():
     """Inject site settings and computed values into all templates"""
-    from models import SiteSetting
-    from datetime import datetime
-    
     try:
-        settings_query = SiteSetting.query.all()
-        settings = {}
-        for setting in settings_query:
-            settings[setting.key] = setting.parsed_value
+        settings = load_site_settings()
             
         # Add computed values for templates
         computed = {}
@@ -150,13 +355,8 @@ def inject_site_settings():
             try:
                 deadline = settings['early_bird_deadline']
                 if isinstance(deadline, str):
-                    # Handle different datetime formats
-                    if 'T' in deadline:
-                        # ISO format: 2025-07-31T23:59:59
-                        deadline = datetime.fromisoformat(deadline)
-                    else:
-                        # Standard format: 2025-07-31 23:59:59
-                        deadline = datetime.strptime(deadline, '%Y-%m-%d %H:%M:%S')
+                    # Accepts both 2025-07-31T23:59:59 and 2025-07-31 23:59:59
+                    deadline = datetime.fromisoformat(deadline)
                 # Use ISO 8601 format for JS (always local time, with explicit 'T')
                 computed['early_bird_deadline_js'] = deadline.strftime('%Y-%m-%dT%H:%M:%S')
                 computed['early_bird_deadline_display'] = deadline.strftime('%B %d')
@@ -173,8 +373,7 @@ def inject_site_settings():
             try:
                 start_date = settings['next_session_start_date']
                 if isinstance(start_date, str):
-                    from datetime import datetime
-                    start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+                    start_date = date.fromisoformat(start_date)
                 computed['session_start_formatted'] = start_date.strftime('%B %d, %Y')
             except:
                 computed['session_start_formatted'] = 'August 6, 2025'
@@ -191,11 +390,15 @@ def inject_site_settings():
         return {'site_settings': {}, 'computed': {}}
 
 # Custom Jinja2 filters
+_NL_RE = re.compile(r'\r\n?|\n')
+
 @app.template_filter('nl2br')
 def nl2br_filter(text):
+    """Escape text and turn CRLF, CR or LF line breaks into <br> tags"""
     if not text:
         return ""
-    return text.replace('\n', '<br>')
+    # escape() leaves already-safe Markup alone, so |safe|nl2br keeps its HTML
+    return Markup(_NL_RE.sub('<br>', str(escape(text))))
 
 @app.template_filter('format_currency')
 def format_currency_filter(amount, currency='AUD'):
@@ -218,8 +421,7 @@ def format_date_filter(date_obj, format_str='%B %d, %Y'):
     try:
         if isinstance(date_obj, str):
             # Try to parse string date
-            from datetime import datetime
-            date_obj = datetime.strptime(date_obj, '%Y-%m-%d').date()
+            date_obj = date.fromisoformat(date_obj)
         return date_obj.strftime(format_str)
     except (ValueError, AttributeError):
         return str(date_obj)
@@ -232,8 +434,7 @@ def format_datetime_filter(datetime_obj, format_str='%B %d, %Y at %I:%M %p'):
     try:
         if isinstance(datetime_obj, str):
             # Try to parse string datetime
-            from datetime import datetime
-            datetime_obj = datetime.strptime(datetime_obj, '%Y-%m-%d %H:%M:%S')
+            datetime_obj = datetime.fromisoformat(datetime_obj)
         return datetime_obj.strftime(format_str)
     except (ValueError, AttributeError):
         return str(datetime_obj)
@@ -244,12 +445,8 @@ def get_dynamic_text(template_text, **kwargs):
         return ""
     
     # Get site settings for context
-    from models import SiteSetting
     try:
-        settings_query = SiteSetting.query.all()
-        settings = {}
-        for setting in settings_query:
-            settings[setting.key] = setting.parsed_value
+        settings = load_site_settings()
             
         # Create context with both settings and passed kwargs
         context = {**settings, **kwargs}
@@ -268,8 +465,7 @@ def get_dynamic_text(template_text, **kwargs):
         if context.get('early_bird_deadline'):
             try:
                 if isinstance(context['early_bird_deadline'], str):
-                    from datetime import datetime
-                    deadline_obj = datetime.strptime(context['early_bird_deadline'], '%Y-%m-%d %H:%M:%S')
+                    deadline_obj = datetime.fromisoformat(context['early_bird_deadline'])
                 else:
                     deadline_obj = context['early_bird_deadline']
                 replacements['{deadline}'] = deadline_obj.strftime('%B %d')
@@ -290,17 +486,63 @@ def get_dynamic_text(template_text, **kwargs):
 app.jinja_env.globals.update(get_dynamic_text=get_dynamic_text)
 # Define cache duration for static pages
 STATIC_PAGE_CACHE = 3600  # 1 hour in seconds
+PUBLIC_PAGE_CACHE_CONTROL = f'public, max-age={STATIC_PAGE_CACHE}'
+NO_STORE_CACHE_CONTROL = 'no-store, no-cache, must-revalidate, max-age=0'
+
+# Cache-Control per public endpoint, applied by add_cache_headers unless a view sets its own
+CACHE_POLICIES = {
+    'index': PUBLIC_PAGE_CACHE_CONTROL,
+    'about': PUBLIC_PAGE_CACHE_CONTROL,
+    'program': PUBLIC_PAGE_CACHE_CONTROL,
+    'pricing': PUBLIC_PAGE_CACHE_CONTROL,
+    'contact': NO_STORE_CACHE_CONTROL,  # Has a form
+    'blog': 'max-age=300',  # 5 minutes
+    'blog_post': 'max-age=600',  # 10 minutes
+}
+RENDERED_PAGE_TTL = 60  # Reuse rendered public pages for up to 1 minute
+
+@lru_cache(maxsize=32)
+def _render_page_cached(template_name, base_url, time_bucket, context_items):
+    """Render a page once and keep both the plain and gzip-compressed bytes with its ETag"""
+    body = render_template(template_name, **dict(context_items)).encode('utf-8')
+    return body, gzip.compress(body, 6), hashlib.sha1(body).hexdigest()
+
+def render_static_page(template_name, **context):
+    """Build a response for a public page, reusing recently rendered HTML when possible"""
+    # Flash messages belong to a single visitor, so those renders are never shared
+    if '_flashes' in session:
+        return make_response(render_template(template_name, **context))
+    
+    # The time bucket lets other workers pick up settings changes within the TTL
+    time_bucket = int(time.time() // RENDERED_PAGE_TTL)
+    # The layout only reads the host and path (og:url, nav highlighting), never the query string,
+    # so tracking parameters like ?utm_source= share one entry instead of each evicting the others
+    body, gzipped, etag = _render_page_cached(template_name, request.base_url, time_bucket, tuple(sorted(context.items())))
+    
+    # Serve the precompressed copy so the page is not compressed again per request
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = app.response_class(gzipped, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gzip'
+    else:
+        response = app.response_class(body, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    
+    # Revalidating clients that already have this version get an empty 304
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def clear_rendered_pages():
+    """Drop cached public page renders after site content changes"""
+    _render_page_cached.cache_clear()
+    _render_blog_post_cached.cache_clear()
 
 @app.route('/')
 def index():
     # Calculate tomorrow's date for the booking form
-    from datetime import datetime, timedelta
     tomorrow_date = (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%d')
     
-    response = make_response(render_template('index.html', tomorrow_date=tomorrow_date))
-    # Set cache control headers
-    response.headers['Cache-Control'] = f'public, max-age={STATIC_PAGE_CACHE}'
-    return response
+    return render_static_page('index.html', tomorrow_date=tomorrow_date)
 
 @app.route('/test-video')
 def test_video():
@@ -314,21 +556,15 @@ def clean_video_test():
 
 @app.route('/about')
 def about():
-    response = make_response(render_template('about.html'))
-    response.headers['Cache-Control'] = f'public, max-age={STATIC_PAGE_CACHE}'
-    return response
+    return render_static_page('about.html')
     
 @app.route('/program')
 def program():
-    response = make_response(render_template('program.html'))
-    response.headers['Cache-Control'] = f'public, max-age={STATIC_PAGE_CACHE}'
-    return response
+    return render_static_page('program.html')
 
 @app.route('/pricing')
 def pricing():
-    response = make_response(render_template('pricing.html'))
-    response.headers['Cache-Control'] = f'public, max-age={STATIC_PAGE_CACHE}'
-    return response
+    return render_static_page('pricing.html')
 
 @app.route('/sitemap.xml')
 def sitemap():
@@ -340,12 +576,17 @@ def robots():
     """Serve the robots.txt file from the static directory"""
     return send_from_directory('static', 'robots.txt', mimetype='text/plain')
 
+def notify_contact_submission(fields):
+    """Email the admins about a stored contact form submission; runs on the background executor"""
+    with app.app_context():
+        try:
+            send_contact_notification(Contact(**fields))
+            app.logger.info(f"Contact notification email sent for {fields['email']}")
+        except Exception as email_error:
+            app.logger.error(f"Error sending contact notification email: {str(email_error)}")
+
 @app.route('/contact', methods=['GET', 'POST'])
 def contact():
-    # Import the Contact model here to avoid circular imports
-    from models import Contact
-    from utils.email import send_contact_notification
-    
     if request.method == 'POST':
         # Check if it's an AJAX request for inline form submission
         is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
@@ -368,35 +609,32 @@ def contact():
                     flash('Please fill out all fields', 'danger')
                     return render_template('contact.html')
             
-            # Create and save contact form data to database
-            new_contact = Contact(
+            # Stamp created_at here so the notification can be built without reading the row back
+            fields = dict(
                 name=name,
                 email=email,
                 phone=phone,
                 subject=subject,
                 message=message,
-                interested=interested
+                interested=interested,
+                created_at=datetime.utcnow()
             )
             
-            # Optimize database operation
-            db.session.add(new_contact)
+            # Core INSERT: nothing reads the row afterwards, so skip the unit-of-work bookkeeping.
+            # It stays in the request so the visitor is only thanked once the message is stored
+            db.session.execute(insert(Contact).values(**fields))
             db.session.commit()
+            clear_dashboard_stats()
             
-            # Send email notification
-            try:
-                send_contact_notification(new_contact)
-                app.logger.info(f"Contact notification email sent for {email}")
-            except Exception as email_error:
-                # Log the error but don't fail the form submission
-                app.logger.error(f"Error sending contact notification email: {str(email_error)}")
+            # Only the SMTP round trip is moved off the request
+            background_executor.submit(notify_contact_submission, fields)
             
             # Return success message
             success_message = 'Thanks! We\'ll contact you shortly.'
             if is_ajax:
                 return jsonify({
                     'success': True, 
-                    'message': success_message,
-                    'contact_id': new_contact.id
+                    'message': success_message
                 })
             else:
                 flash(success_message, 'success')
@@ -435,10 +673,7 @@ def contact():
             flash(f'Error in test email functionality: {str(e)}', 'danger')
     
     # GET request - render the contact form
-    response = make_response(render_template('contact.html'))
-    # No caching for the contact page since it has a form
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    return render_template('contact.html')
 
 # Redirect /enroll to the contact page
 @app.route('/enroll', methods=['GET'])
@@ -453,8 +688,6 @@ def test_email():
     if not app.config.get('TESTING_EMAIL_ENABLED', False):
         return "Email testing is disabled in production environment", 403
     
-    from utils.email import send_email
-    
     try:
         # Send a test email to both admin emails
         primary_admin_email = app.config.get('ADMIN_EMAIL')
@@ -507,6 +740,126 @@ This test email was sent to all configured admin email addresses.
         app.logger.error(f"Error sending test email: {str(e)}")
         return f"Error sending test email: {str(e)}", 500
 
+# Analytics writes are queued by the request hooks and written in batches by one thread per worker
+ANALYTICS_BATCH_SIZE = 200
+ANALYTICS_FLUSH_INTERVAL = 2  # Seconds to wait for a batch to fill before writing it anyway
+analytics_queue = queue.SimpleQueue()
+
+def write_analytics_batch(events):
+    """Insert queued analytics rows and apply coalesced session updates in one transaction"""
+    inserts = {ReferralSource: [], PageView: [], SessionDuration: [], ButtonClick: []}
+    session_hits = {}  # session_id -> [latest end_time, extra pages viewed]
+    for kind, data in events:
+        if kind == 'session_hit':
+            session_id, end_time, pages = data
+            hit = session_hits.setdefault(session_id, [end_time, 0])
+            hit[0] = max(hit[0], end_time)
+            hit[1] += pages
+        else:
+            inserts[kind].append(data)
+    
+    # Referrals and session starts go in before the updates that may refer to them
+    for model, rows in inserts.items():
+        if rows:
+            db.session.execute(insert(model), rows)
+    
+    if session_hits:
+        start_times = dict(db.session.execute(
+            select(SessionDuration.session_id, SessionDuration.start_time)
+            .where(SessionDuration.session_id.in_(session_hits))
+        ).all())
+        params = [
+            {
+                'b_session_id': session_id,
+                'b_end_time': end_time,
+                'b_duration': int((end_time - start_times[session_id]).total_seconds()),
+                'b_pages': pages,
+            }
+            for session_id, (end_time, pages) in session_hits.items()
+            if session_id in start_times
+        ]
+        if params:
+            # Table-level UPDATE so the parameter list runs as a plain executemany
+            sessions = SessionDuration.__table__
+            db.session.execute(
+                update(sessions)
+                .where(sessions.c.session_id == bindparam('b_session_id'))
+                .values(
+                    end_time=bindparam('b_end_time'),
+                    duration_seconds=bindparam('b_duration'),
+                    pages_viewed=sessions.c.pages_viewed + bindparam('b_pages')
+                ),
+                params
+            )
+    
+    db.session.commit()
+
+def analytics_writer():
+    """Drain analytics_queue: write up to ANALYTICS_BATCH_SIZE events at a time, at least every flush interval"""
+    running = True
+    while running:
+        events = [analytics_queue.get()]
+        deadline = time.monotonic() + ANALYTICS_FLUSH_INTERVAL
+        while len(events) < ANALYTICS_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                events.append(analytics_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        
+        # None is the shutdown marker; write whatever arrived before it
+        if None in events:
+            running = False
+            events = [event for event in events if event is not None]
+        if not events:
+            continue
+        
+        with app.app_context():
+            flush_analytics_events(events)
+
+def flush_analytics_events(events):
+    """Write a batch of events; if the batch fails, retry them one at a time so one bad row only loses itself"""
+    try:
+        write_analytics_batch(events)
+        return
+    except Exception as e:
+        db.session.rollback()
+        app.logger.warning(f"Error writing {len(events)} analytics events, retrying individually: {str(e)}")
+    
+    dropped = 0
+    for event in events:
+        try:
+            write_analytics_batch([event])
+        except Exception as e:
+            db.session.rollback()
+            dropped += 1
+            app.logger.error(f"Dropping analytics event {event[0]!r}: {str(e)}")
+    if dropped:
+        app.logger.error(f"Dropped {dropped} of {len(events)} analytics events")
+
+# The writer thread is started by the first queued event, so importing the app (CLI commands,
+# tests, gunicorn's master before it forks) doesn't leave a thread running
+analytics_thread = None
+_analytics_thread_lock = threading.Lock()
+
+def queue_analytics(event):
+    """Queue one analytics event for the writer thread, starting the thread if this worker has none yet"""
+    global analytics_thread
+    if analytics_thread is None or not analytics_thread.is_alive():
+        with _analytics_thread_lock:
+            if analytics_thread is None or not analytics_thread.is_alive():
+                analytics_thread = threading.Thread(target=analytics_writer, name='analytics-writer', daemon=True)
+                analytics_thread.start()
+    analytics_queue.put(event)
+
+@atexit.register
+def stop_analytics_writer():
+    if analytics_thread is not None and analytics_thread.is_alive():
+        analytics_queue.put(None)
+        analytics_thread.join(timeout=5)
+
 # Analytics helper functions
 def get_visitor_id():
     """Generate or retrieve a unique visitor ID for analytics tracking"""
@@ -516,49 +869,67 @@ def get_visitor_id():
         session['visitor_id'] = visitor_id
     return session.get('visitor_id')
 
+# Every marker parse_user_agent looks at, found in a single regex pass
+_UA_TOKEN_RE = re.compile(r'MSIE|Trident|Edge|Chrome|Safari|Firefox|Opera|OPR|Windows|Mac OS|Android|Linux|iPhone|iPad|Mobile')
+
+@lru_cache(maxsize=1024)
 def parse_user_agent(user_agent_string):
     """Parse the User-Agent string to extract browser, OS, and device type"""
+    # Visitors share a small set of User-Agent strings, so most calls are cache hits
+    tokens = set(_UA_TOKEN_RE.findall(user_agent_string))
     browser = "Unknown"
     os_name = "Unknown"
     device_type = "desktop"
     
     # Simple parsing for browser detection
-    if "MSIE" in user_agent_string or "Trident" in user_agent_string:
+    if "MSIE" in tokens or "Trident" in tokens:
         browser = "Internet Explorer"
-    elif "Edge" in user_agent_string:
+    elif "Edge" in tokens:
         browser = "Edge"
-    elif "Chrome" in user_agent_string and "Safari" in user_agent_string and "Edge" not in user_agent_string:
+    elif "Chrome" in tokens and "Safari" in tokens:
         browser = "Chrome"
-    elif "Firefox" in user_agent_string:
+    elif "Firefox" in tokens:
         browser = "Firefox"
-    elif "Safari" in user_agent_string and "Chrome" not in user_agent_string:
+    elif "Safari" in tokens and "Chrome" not in tokens:
         browser = "Safari"
-    elif "Opera" in user_agent_string or "OPR" in user_agent_string:
+    elif "Opera" in tokens or "OPR" in tokens:
         browser = "Opera"
     
     # Simple parsing for OS detection
-    if "Windows" in user_agent_string:
+    if "Windows" in tokens:
         os_name = "Windows"
-    elif "Mac OS" in user_agent_string:
+    elif "Mac OS" in tokens:
         os_name = "macOS"
-    elif "Android" in user_agent_string:
+    elif "Android" in tokens:
         os_name = "Android"
-        device_type = "mobile" if "Mobile" in user_agent_string else "tablet"
-    elif "Linux" in user_agent_string:
+    elif "Linux" in tokens:
         os_name = "Linux"
-    elif "iPhone" in user_agent_string:
+    elif "iPhone" in tokens:
         os_name = "iOS"
         device_type = "mobile"
-    elif "iPad" in user_agent_string:
+    elif "iPad" in tokens:
         os_name = "iOS"
         device_type = "tablet"
     
     # Mobile detection
-    if "Mobile" in user_agent_string or "Android" in user_agent_string:
+    if "Mobile" in tokens or "Android" in tokens:
         device_type = "mobile"
     
     return browser, os_name, device_type
 
+# Known referrer sources, matched against each label of the referring host (www.google.com.au -> google)
+REFERRER_SOURCES = {
+    'google': ('google', 'organic'),
+    'bing': ('bing', 'organic'),
+    'yahoo': ('yahoo', 'organic'),
+    'facebook': ('facebook', 'social'),
+    'fb': ('facebook', 'social'),
+    'instagram': ('instagram', 'social'),
+    'twitter': ('twitter', 'social'),
+    'linkedin': ('linkedin', 'social'),
+}
+
+@lru_cache(maxsize=4096)
 def parse_referrer(referrer):
     """Parse the referrer URL to determine the source"""
     if not referrer:
@@ -568,26 +939,17 @@ def parse_referrer(referrer):
     try:
         parsed_url = urlparse(referrer)
         domain = parsed_url.netloc
+        host = parsed_url.hostname or ''
         
-        # Check for search engines
-        if "google" in domain:
-            return "google", "organic", None
-        elif "bing" in domain:
-            return "bing", "organic", None
-        elif "yahoo" in domain:
-            return "yahoo", "organic", None
-        # Check for social media
-        elif "facebook" in domain or "fb.com" in domain:
-            return "facebook", "social", None
-        elif "instagram" in domain:
-            return "instagram", "social", None
-        elif "twitter" in domain or "t.co" in domain:
+        # Twitter's link shortener
+        if host == 't.co':
             return "twitter", "social", None
-        elif "linkedin" in domain:
-            return "linkedin", "social", None
-        else:
-            # External referral
-            return domain, "referral", None
+        for label in host.split('.'):
+            known = REFERRER_SOURCES.get(label)
+            if known:
+                return known[0], known[1], None
+        # External referral
+        return domain, "referral", None
     except:
         return "unknown", None, None
 
@@ -641,17 +1003,18 @@ def handle_domains():
             return redirect(url, code=301)
 
 # Track page views before each request
+ANALYTICS_SKIP_PREFIXES = ('/static/', '/admin/', '/api/')
+ANALYTICS_SKIP_PATHS = frozenset({'/favicon.ico', '/robots.txt', '/sitemap.xml'})
+_BOT_RE = re.compile(r'bot|crawl|spider|slurp|preview', re.IGNORECASE)
+
 @app.before_request
 def track_page_view():
     """Track page views for analytics"""
-    # Only track GET requests
-    if request.method != 'GET':
-        return
-    
-    # Skip tracking for static files, favicon, and admin pages
-    if (request.path.startswith('/static/') or 
-        request.path == '/favicon.ico' or
-        request.path.startswith('/admin/')):
+    # Only track GET page requests from people: no assets, admin, API calls or crawlers
+    if (request.method != 'GET' or
+            request.path in ANALYTICS_SKIP_PATHS or
+            request.path.startswith(ANALYTICS_SKIP_PREFIXES) or
+            _BOT_RE.search(request.headers.get('User-Agent', ''))):
         return
     
     # Get visitor ID
@@ -660,74 +1023,52 @@ def track_page_view():
     # Store the request start time for duration calculation
     g.request_start_time = datetime.utcnow()
     
-    try:
-        # Extract useful information
-        user_agent_string = request.headers.get('User-Agent', '')
-        browser, os_name, device_type = parse_user_agent(user_agent_string)
-        
-        # Get the referrer
-        referrer = request.referrer or ''
-        
-        # Import the models
-        from models import PageView, ReferralSource, VisitorLocation, SessionDuration
-        
-        # Check if this is a new session
-        create_new_session = False
-        
-        session_id = session.get('session_id')
-        if not session_id:
-            session_id = str(uuid.uuid4())
-            session['session_id'] = session_id
-            create_new_session = True
-            
-            # Store the referrer for new sessions
-            source, medium, campaign = parse_referrer(referrer)
-            
-            # Add referral source if it exists
-            if referrer and source != "direct":
-                referral = ReferralSource(
-                    source=source,
-                    medium=medium,
-                    campaign=campaign,
-                    visitor_id=visitor_id,
-                    landing_page=request.path
-                )
-                db.session.add(referral)
-        
-        # Create a new page view record
-        page_view = PageView(
-            path=request.path,
-            ip_address=request.remote_addr,
-            user_agent=user_agent_string,
-            referrer=referrer,
-            visitor_id=visitor_id,
-            browser=browser,
-            os=os_name,
-            device_type=device_type
-        )
-        db.session.add(page_view)
-        
-        # If it's a new session, create a session record
-        if create_new_session:
-            session_duration = SessionDuration(
-                visitor_id=visitor_id,
-                session_id=session_id,
-                start_time=datetime.utcnow()
-            )
-            db.session.add(session_duration)
-        else:
-            # Update existing session with new page view
-            session_duration = SessionDuration.query.filter_by(session_id=session_id).first()
-            if session_duration:
-                session_duration.pages_viewed = session_duration.pages_viewed + 1
-        
-        # Commit the changes
-        db.session.commit()
-        
-    except Exception as e:
-        # Don't break the site if analytics tracking fails
-        db.session.rollback()
-        app.logger.error(f"Error tracking page view: {str(e)}")
+    # Rows are only queued here; analytics_writer inserts them in batches off the request path
+    now = g.request_start_time
+    user_agent_string = request.headers.get('User-Agent', '')
+    browser, os_name, device_type = parse_user_agent(user_agent_string)
+    
+    # Get the referrer
+    referrer = request.referrer or ''
+    
+    session_id = session.get('session_id')
+    if not session_id:
+        session_id = str(uuid.uuid4())
+        session['session_id'] = session_id
+        g.new_analytics_session = True
+        
+        # Store the referrer for new sessions
+        source, medium, campaign = parse_referrer(referrer)
+        
+        # Add referral source if it exists
+        if referrer and source != "direct":
+            queue_analytics((ReferralSource, {
+                'source': source[:100],
+                'medium': medium,
+                'campaign': campaign,
+                'visitor_id': visitor_id,
+                'landing_page': request.path[:255],
+                'timestamp': now,
+            }))
+        
+        queue_analytics((SessionDuration, {
+            'visitor_id': visitor_id,
+            'session_id': session_id,
+            'start_time': now,
+        }))
+    
+    # Column limits are enforced here so one oversized header can't fail a whole batch
+    queue_analytics((PageView, {
+        'path': request.path[:255],
+        'ip_address': request.remote_addr,
+        'user_agent': user_agent_string[:255],
+        'referrer': referrer[:255],
+        'visitor_id': visitor_id,
+        'browser': browser,
+        'os': os_name,
+        'device_type': device_type,
+        'timestamp': now,
+    }))
 
 # Track button clicks (this will be called from JavaScript)
 @app.route('/api/track-click', methods=['POST'])
@@ -746,67 +1087,61 @@ def track_button_click():
         # Get visitor ID
         visitor_id = get_visitor_id()
         
-        # Import the model
-        from models import ButtonClick
-        
-        # Create a new button click record
-        button_click = ButtonClick(
-            button_id=button_id,
-            button_text=button_text,
-            page_path=page_path,
-            visitor_id=visitor_id,
-            ip_address=request.remote_addr
-        )
-        db.session.add(button_click)
-        db.session.commit()
+        # Queued for the analytics writer's batched INSERT, like page views
+        queue_analytics((ButtonClick, {
+            'button_id': str(button_id)[:100],
+            'button_text': str(button_text)[:100] if button_text else button_text,
+            'page_path': str(page_path)[:255],
+            'visitor_id': visitor_id,
+            'ip_address': request.remote_addr,
+            'timestamp': datetime.utcnow(),
+        }))
         
         return jsonify({'status': 'success'})
         
     except Exception as e:
-        db.session.rollback()
         app.logger.error(f"Error tracking button click: {str(e)}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
-# Configure static files with long cache time
 @app.after_request
 def add_cache_headers(response):
-    """Add cache headers to static files"""
-    # Check if the request is for a static file
-    if request.path.startswith('/static/'):
-        # Determine file type and set appropriate cache time
-        if any(request.path.endswith(ext) for ext in ['.css', '.js']):
-            max_age = 2592000  # 30 days for CSS and JS
-        elif any(request.path.endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.ico', '.svg']):
-            max_age = 7776000  # 90 days for images
-        else:
-            max_age = 86400  # 1 day for other static files
-            
-        response.headers['Cache-Control'] = f'public, max-age={max_age}'
-    
-    # Update session duration if applicable
-    try:
-        if hasattr(g, 'request_start_time') and request.method == 'GET':
-            session_id = session.get('session_id')
-            if session_id:
-                from models import SessionDuration
-                session_duration = SessionDuration.query.filter_by(session_id=session_id).first()
-                if session_duration:
-                    session_duration.end_time = datetime.utcnow()
-                    if session_duration.start_time:
-                        duration = session_duration.end_time - session_duration.start_time
-                        session_duration.duration_seconds = int(duration.total_seconds())
-                    db.session.commit()
-    except Exception as e:
-        db.session.rollback()
-        app.logger.error(f"Error updating session duration: {str(e)}")
+    """Apply the Cache-Control policy for static assets, admin pages and public endpoints"""
+    if request.endpoint == 'static':
+        # A ?v= URL changes whenever the file does, so browsers need not revalidate it
+        if 'v' in request.args:
+            response.cache_control.immutable = True
+    elif request.path.startswith('/admin'):
+        response.headers['Cache-Control'] = NO_STORE_CACHE_CONTROL
+    elif request.endpoint in CACHE_POLICIES and 'Cache-Control' not in response.headers:
+        response.headers['Cache-Control'] = CACHE_POLICIES[request.endpoint]
+    return response
+
+@app.after_request
+def update_session_duration(response):
+    """Record how long the visitor's session has lasted so far"""
+    if hasattr(g, 'request_start_time') and request.method == 'GET':
+        session_id = session.get('session_id')
+        if session_id:
+            # The page that started a session is already counted by its pages_viewed default of 1
+            pages = 0 if g.get('new_analytics_session') else 1
+            queue_analytics(('session_hit', (session_id, datetime.utcnow(), pages)))
     
     return response
 
 # Admin routes
+@app.before_request
+def require_admin_login():
+    """Send anonymous visitors on any /admin page except the login form to the login page"""
+    if DEBUG_MODE or not request.path.startswith('/admin') or request.endpoint == 'admin_login':
+        return
+    if not current_user.is_authenticated:
+        return login_manager.unauthorized()
+
+LAST_LOGIN_RESOLUTION = timedelta(hours=1)  # last_login is informational, so hourly precision is enough
+
 @app.route('/admin/login', methods=['GET', 'POST'])
 def admin_login():
     # Temporarily disabled authentication - direct access to admin dashboard
-    from models import Admin
     
     # Get or create a temporary admin user for access
     user = Admin.query.first()
@@ -819,12 +1154,16 @@ def admin_login():
     
     # Auto-login the user
     login_user(user)
+    # Skip the write on repeat logins within the hour
+    now = datetime.utcnow()
+    if user.last_login is None or now - user.last_login > LAST_LOGIN_RESOLUTION:
+        user.last_login = now
+        db.session.commit()
     flash('Temporary admin access granted', 'info')
     
     return redirect(url_for('admin_dashboard'))
 
 @app.route('/admin/logout')
-@login_required
 def admin_logout():
     logout_user()
     flash('You have been logged out', 'info')
@@ -834,10 +1173,6 @@ def admin_logout():
 @app.route('/book-info-session', methods=['POST'])
 def book_info_session():
     """Route to handle booking info session submissions from the custom calendar system"""
-    from models import InfoSessionBooking
-    from utils.email import send_booking_confirmation_email
-    from datetime import datetime, date
-    
     # Check if it's an AJAX request
     is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
     
@@ -860,7 +1195,7 @@ def book_info_session():
         
         # Parse date and time
         try:
-            preferred_date = datetime.strptime(preferred_date_str, '%Y-%m-%d').date()
+            preferred_date = date.fromisoformat(preferred_date_str)
             preferred_time = datetime.strptime(preferred_time_str, '%H:%M').time()
         except ValueError:
             if is_ajax:
@@ -914,9 +1249,6 @@ def book_info_session():
 
 @app.route('/info-session-register', methods=['POST'])
 def collect_info_session_email():
-    from models import InfoSessionEmail
-    from utils.email import send_zoom_link_email
-    
     if request.method == 'POST':
         email = request.form.get('email', '').strip()
         
@@ -924,43 +1256,45 @@ def collect_info_session_email():
             flash('Please provide your email address', 'danger')
             return redirect(url_for('index'))
         
-        # Check if email already exists
-        existing_email = InfoSessionEmail.query.filter_by(email=email).first()
-        if existing_email:
-            flash('✅ Thank you! You\'ll receive the Zoom link soon via email.', 'success')
-            return redirect(url_for('index'))
-        
         try:
-            # Create new info session email record with pending status
-            new_email = InfoSessionEmail(
-                email=email,
-                confirmation_status='pending'
-            )
-            db.session.add(new_email)
+            # One round-trip, and no race between two signups with the same address:
+            # INSERT ... ON CONFLICT (email) DO NOTHING only returns an id for a new row
+            new_email_id = db.session.execute(
+                insert_or_ignore(InfoSessionEmail, ['email'])
+                .values(email=email, confirmation_status='pending')
+                .returning(InfoSessionEmail.id)
+            ).scalar()
             db.session.commit()
             
+            if new_email_id is None:
+                # Already registered
+                flash('✅ Thank you! You\'ll receive the Zoom link soon via email.', 'success')
+                return redirect(url_for('index'))
+            
             # Send confirmation email
             try:
                 email_sent = send_info_session_confirmation(email)
                 if email_sent:
                     app.logger.info(f"Info session confirmation email sent to {email}")
-                    # Update confirmation status to delivered
-                    new_email.confirmation_status = 'delivered'
-                    db.session.commit()
+                    confirmation_status = 'delivered'
                 else:
                     app.logger.warning(f"Failed to send info session confirmation email to {email}")
-                    # Update confirmation status to bounced
-                    new_email.confirmation_status = 'bounced'
-                    db.session.commit()
+                    confirmation_status = 'bounced'
             except Exception as email_error:
                 # Log the error but don't fail the form submission
                 app.logger.error(f"Error sending info session confirmation email: {str(email_error)}")
-                # Update confirmation status to bounced
-                new_email.confirmation_status = 'bounced'
-                db.session.commit()
+                confirmation_status = 'bounced'
+            
+            db.session.execute(
+                update(InfoSessionEmail)
+                .where(InfoSessionEmail.id == new_email_id)
+                .values(confirmation_status=confirmation_status)
+            )
+            db.session.commit()
             
             flash('✅ Thank you! You\'ll receive the Zoom link soon via email.', 'success')
         except Exception as db_error:
+            db.session.rollback()
             app.logger.error(f"Error saving info session email: {str(db_error)}")
             flash('There was an error processing your request. Please try again.', 'danger')
             
@@ -974,11 +1308,7 @@ def blog():
     # TEMPORARILY MODIFIED: Show "Coming Soon" message instead of blog posts for official launch
     # The original blog functionality is commented out but preserved
     
-    response = make_response(render_template(
-        'blog/coming-soon.html'
-    ))
-    response.headers['Cache-Control'] = 'max-age=300'  # Cache for 5 minutes
-    return response
+    return render_template('blog/coming-soon.html')
     
     '''
     # Original code - temporarily disabled for launch
@@ -1014,11 +1344,12 @@ def blog():
     return response
     '''
 
-@app.route('/blog/<slug>')
-def blog_post(slug):
-    from models import BlogPost
-    
-    post = BlogPost.query.filter_by(slug=slug, is_published=True).first_or_404()
+BLOG_POST_TTL = 300  # Reuse rendered blog posts for up to 5 minutes
+
+def render_blog_post(slug):
+    """Render a published blog post with its related posts"""
+    # The template shows the author, so load it in the same query
+    post = BlogPost.query.options(joinedload(BlogPost.author)).filter_by(slug=slug, is_published=True).first_or_404()
     
     # Get related posts (same category, excluding current post)
     related_posts = []
@@ -1029,171 +1360,243 @@ def blog_post(slug):
             BlogPost.is_published == True
         ).order_by(BlogPost.created_at.desc()).limit(3).all()
     
-    response = make_response(render_template(
+    return render_template(
         'blog/post.html',
         post=post,
         related_posts=related_posts
-    ))
-    response.headers['Cache-Control'] = 'max-age=600'  # Cache for 10 minutes
-    return response
+    )
+
+@lru_cache(maxsize=64)
+def _render_blog_post_cached(slug, base_url, time_bucket):
+    return render_blog_post(slug)
+
+@app.route('/blog/<slug>')
+def blog_post(slug):
+    # Flash messages belong to a single visitor, so those renders are never shared
+    if '_flashes' in session:
+        return render_blog_post(slug)
+    # Keyed on host + path only: the share links use request.base_url, so query strings don't change the page
+    return _render_blog_post_cached(slug, request.base_url, int(time.time() // BLOG_POST_TTL))
+
+DASHBOARD_STATS_TTL = 30  # Seconds to reuse dashboard counts between refreshes
+_dashboard_stats = {'expires': 0, 'value': None}
+
+def get_dashboard_stats(s):
+    """Return the dashboard's contact and class session counts, cached for a short TTL"""
+    now = time.time()
+    if _dashboard_stats['value'] is not None and now < _dashboard_stats['expires']:
+        return _dashboard_stats['value']
+    
+    # Count contacts by status and class assignment in a single scan
+    (total_contacts, interested_contacts, unread_contacts,
+     fall_contacts, spring_contacts) = s.query(
+        func.count(Contact.id),
+        func.count(Contact.id).filter(Contact.interested == True),
+        func.count(Contact.id).filter(Contact.is_read == False),
+        func.count(Contact.id).filter(Contact.class_assignment == 'fall'),
+        func.count(Contact.id).filter(Contact.class_assignment == 'spring')
+    ).one()
+    
+    # Get active class session counts per type
+    session_counts = dict(
+        s.query(ClassSession.session_type, func.count(ClassSession.id))
+        .filter(ClassSession.is_active == True)
+        .group_by(ClassSession.session_type)
+        .all()
+    )
+    
+    stats = {
+        'total_contacts': total_contacts,
+        'interested_contacts': interested_contacts,
+        'unread_contacts': unread_contacts,
+        'fall_contacts': fall_contacts,
+        'spring_contacts': spring_contacts,
+        'active_sessions': sum(session_counts.values()),
+        'fall_sessions': session_counts.get('fall', 0),
+        'spring_sessions': session_counts.get('spring', 0),
+    }
+    _dashboard_stats.update(value=stats, expires=now + DASHBOARD_STATS_TTL)
+    return stats
+
+def load_enrolled_students(s):
+    """Return the (fall, spring) enrolled students with only the columns the admin tables show"""
+    rows = s.query(
+        Contact.class_assignment, Contact.name, Contact.email, Contact.phone, Contact.created_at
+    ).filter(
+        Contact.is_enrolled == True,
+        Contact.class_assignment.in_(('fall', 'spring'))
+    ).all()
+    
+    enrolled = {'fall': [], 'spring': []}
+    for row in rows:
+        enrolled[row.class_assignment].append(row)
+    return enrolled['fall'], enrolled['spring']
+
+def clear_dashboard_stats():
+    """Drop cached dashboard counts after contacts or class sessions change"""
+    _dashboard_stats['value'] = None
 
 @app.route('/admin')
-@login_required
 def admin_dashboard():
-    # Import models
-    from models import Contact, Testimonial, FAQ, ClassSession
+    # Reads go through the request's own session: the connection login_manager already
+    # checked out for current_user is reused instead of taking a second one from the pool
+    s = db.session
     
     # Get recent contacts (last 10)
-    recent_contacts = Contact.query.order_by(Contact.created_at.desc()).limit(10).all()
-    
-    # Count all contacts
-    total_contacts = Contact.query.count()
-    
-    # Count interested contacts
-    interested_contacts = Contact.query.filter_by(interested=True).count()
-    
-    # Count unread contacts
-    unread_contacts = Contact.query.filter_by(is_read=False).count()
+    recent_contacts = s.query(Contact).order_by(Contact.created_at.desc()).limit(10).all()
     
-    # Count contacts by class assignment
-    fall_contacts = Contact.query.filter_by(class_assignment='fall').count()
-    spring_contacts = Contact.query.filter_by(class_assignment='spring').count()
+    stats = get_dashboard_stats(s)
     
-    # Get enrolled students by class assignment
-    fall_enrolled = Contact.query.filter_by(class_assignment='fall', is_enrolled=True).all()
-    spring_enrolled = Contact.query.filter_by(class_assignment='spring', is_enrolled=True).all()
-    fall_enrolled_count = len(fall_enrolled)
-    spring_enrolled_count = len(spring_enrolled)
+    fall_enrolled, spring_enrolled = load_enrolled_students(s)
     
-    # Get class sessions counts
-    active_sessions = ClassSession.query.filter_by(is_active=True).count()
-    fall_sessions = ClassSession.query.filter_by(session_type='fall', is_active=True).count()
-    spring_sessions = ClassSession.query.filter_by(session_type='spring', is_active=True).count()
-    
-    # Get testimonials
-    testimonials = Testimonial.query.order_by(Testimonial.is_featured.desc(), Testimonial.created_at.desc()).all()
-    
-    # Get FAQs
-    faqs = FAQ.query.order_by(FAQ.position).all()
-    
-    response = make_response(render_template(
+    return render_template(
         'admin/dashboard.html',
         recent_contacts=recent_contacts,
-        total_contacts=total_contacts,
-        interested_contacts=interested_contacts,
-        unread_contacts=unread_contacts,
-        unread_count=unread_contacts,  # For sidebar badge
-        fall_contacts=fall_contacts,
-        spring_contacts=spring_contacts,
+        unread_count=stats['unread_contacts'],  # For sidebar badge
         fall_enrolled=fall_enrolled,
         spring_enrolled=spring_enrolled,
-        fall_enrolled_count=fall_enrolled_count,
-        spring_enrolled_count=spring_enrolled_count,
-        active_sessions=active_sessions,
-        fall_sessions=fall_sessions,
-        spring_sessions=spring_sessions,
-        testimonials=testimonials,
-        faqs=faqs
-    ))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+        fall_enrolled_count=len(fall_enrolled),
+        spring_enrolled_count=len(spring_enrolled),
+        **stats
+    )
+
+CONTACTS_PER_PAGE = 50
 
 @app.route('/admin/contacts')
-@login_required
 def admin_contacts():
-    # Import Contact model
-    from models import Contact
+    page = request.args.get('page', 1, type=int)
     
-    # Get all contacts, ordered by most recent first, with unread first
-    contacts = Contact.query.order_by(Contact.is_read, Contact.created_at.desc()).all()
+    # Get one page of contacts, unread first and then most recent first
+    contacts = SelectPagination(
+        select=select(Contact).order_by(Contact.is_read, Contact.created_at.desc()),
+        session=db.session,
+        page=page,
+        per_page=CONTACTS_PER_PAGE,
+        error_out=False
+    )
     
     # Count unread messages
     unread_count = Contact.query.filter_by(is_read=False).count()
     
-    response = make_response(render_template(
+    return render_template(
         'admin/contacts.html', 
         contacts=contacts,
         unread_count=unread_count
-    ))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    )
+
+def update_contact_or_404(contact_id, **values):
+    """Update columns on one contact in a single UPDATE, aborting with 404 if it does not exist"""
+    result = db.session.execute(update(Contact).where(Contact.id == contact_id).values(**values))
+    if result.rowcount == 0:
+        abort(404)
+
+def delete_by_id(model, object_id, *columns):
+    """Delete one row in a single DELETE ... RETURNING; returns the requested columns, or None if no row matched"""
+    return db.session.execute(
+        delete(model).where(model.id == object_id).returning(model.id, *columns)
+    ).first()
 
 @app.route('/admin/contacts/<int:contact_id>/mark-read', methods=['POST'])
-@login_required
 def mark_contact_as_read(contact_id):
-    from models import Contact
-    
-    contact = Contact.query.get_or_404(contact_id)
-    contact.is_read = True
+    update_contact_or_404(contact_id, is_read=True)
     db.session.commit()
+    clear_dashboard_stats()
     
     flash('Message marked as read', 'success')
     return redirect(url_for('admin_contacts'))
 
 @app.route('/admin/contacts/<int:contact_id>/mark-unread', methods=['POST'])
-@login_required
 def mark_contact_as_unread(contact_id):
-    from models import Contact
-    
-    contact = Contact.query.get_or_404(contact_id)
-    contact.is_read = False
+    update_contact_or_404(contact_id, is_read=False)
     db.session.commit()
+    clear_dashboard_stats()
     
     flash('Message marked as unread', 'success')
     return redirect(request.referrer or url_for('admin_contacts'))
 
 @app.route('/admin/contacts/<int:contact_id>/mark-read-ajax', methods=['POST'])
-@login_required
 def mark_contact_as_read_ajax(contact_id):
-    from models import Contact
-    
     try:
-        contact = Contact.query.get_or_404(contact_id)
-        contact.is_read = True
+        update_contact_or_404(contact_id, is_read=True)
         db.session.commit()
+        clear_dashboard_stats()
         return jsonify({'success': True, 'message': 'Message marked as read'})
     except Exception as e:
         app.logger.error(f"Error marking contact as read: {str(e)}")
         return jsonify({'success': False, 'message': str(e)}), 500
         
 @app.route('/admin/contacts/<int:contact_id>/mark-unread-ajax', methods=['POST'])
-@login_required
 def mark_contact_as_unread_ajax(contact_id):
-    from models import Contact
-    
     try:
-        contact = Contact.query.get_or_404(contact_id)
-        contact.is_read = False
+        update_contact_or_404(contact_id, is_read=False)
         db.session.commit()
+        clear_dashboard_stats()
         return jsonify({'success': True, 'message': 'Message marked as unread'})
     except Exception as e:
         app.logger.error(f"Error marking contact as unread: {str(e)}")
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@app.route('/admin/contacts/mark-read-batch', methods=['POST'])
+def mark_contacts_as_read_batch():
+    """Mark several contacts as read (or unread) in one UPDATE and one commit"""
+    # The inbox script batches its clicks as JSON; the "Mark Page as Read" button posts a form
+    payload = request.get_json(silent=True)
+    if payload is not None:
+        if not isinstance(payload, dict):
+            return jsonify({'success': False, 'message': 'Expected a JSON object'}), 400
+        contact_ids = payload.get('ids', [])
+        if not isinstance(contact_ids, list) or not all(
+            isinstance(contact_id, int) and not isinstance(contact_id, bool) for contact_id in contact_ids
+        ):
+            return jsonify({'success': False, 'message': 'Invalid contact ids'}), 400
+        is_read = payload.get('is_read', True)
+        if not isinstance(is_read, bool):
+            return jsonify({'success': False, 'message': 'is_read must be true or false'}), 400
+    else:
+        contact_ids = request.form.getlist('ids', type=int)
+        is_read = True
+    
+    updated = 0
+    if contact_ids:
+        try:
+            result = db.session.execute(
+                update(Contact).where(Contact.id.in_(contact_ids)).values(is_read=is_read)
+            )
+            db.session.commit()
+            updated = result.rowcount
+            clear_dashboard_stats()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Error updating contacts {contact_ids}: {str(e)}")
+            if payload is not None:
+                return jsonify({'success': False, 'message': 'Could not update contacts'}), 500
+            flash('Could not update the selected messages', 'danger')
+            return redirect(request.referrer or url_for('admin_contacts'))
+    
+    if payload is not None:
+        return jsonify({'success': True, 'updated': updated})
+    
+    flash(f'{updated} messages marked as read', 'success')
+    return redirect(request.referrer or url_for('admin_contacts'))
+
 @app.route('/admin/contacts/<int:contact_id>/assign-class', methods=['POST'])
-@login_required
 def assign_contact_to_class(contact_id):
-    from models import Contact
-    
-    contact = Contact.query.get_or_404(contact_id)
     class_assignment = request.form.get('class_assignment', '')
     
     # If empty string, set to None (unassigned)
     if class_assignment == '':
         class_assignment = None
         
-    contact.class_assignment = class_assignment
+    update_contact_or_404(contact_id, class_assignment=class_assignment)
     db.session.commit()
+    clear_dashboard_stats()
     
     flash('Contact assigned to class successfully', 'success')
     return redirect(request.referrer or url_for('admin_contacts'))
 
 @app.route('/admin/contacts/<int:contact_id>/enroll', methods=['POST'])
-@login_required
 def enroll_contact(contact_id):
-    from models import Contact, ClassSession
-    
-    contact = Contact.query.get_or_404(contact_id)
+    contact = db.get_or_404(Contact, contact_id)
     phone = request.form.get('phone', '')
     
     # Make sure contact has been assigned to a class
@@ -1221,84 +1624,107 @@ def enroll_contact(contact_id):
             session.current_enrollment += 1
     
     db.session.commit()
+    clear_dashboard_stats()
     
     flash(f'Contact has been enrolled in {class_type} class successfully', 'success')
     return redirect(request.referrer or url_for('admin_contacts'))
 
+@app.route('/admin/contacts/bulk-enroll', methods=['POST'])
+def bulk_enroll_contacts():
+    """Enroll several contacts in their assigned classes in a single transaction"""
+    contact_ids = request.form.getlist('contact_ids', type=int)
+    
+    # Only contacts with a class that aren't enrolled yet count towards session numbers;
+    # like enroll_contact, an empty class_assignment counts as no class
+    pending = (
+        Contact.id.in_(contact_ids),
+        Contact.is_enrolled == False,
+        Contact.class_assignment.isnot(None),
+        Contact.class_assignment != ''
+    )
+    new_per_class = dict(
+        db.session.query(Contact.class_assignment, func.count(Contact.id))
+        .filter(*pending)
+        .group_by(Contact.class_assignment)
+        .all()
+    ) if contact_ids else {}
+    
+    if new_per_class:
+        db.session.execute(update(Contact).where(*pending).values(is_enrolled=True))
+        for class_type, new_count in new_per_class.items():
+            db.session.execute(
+                update(ClassSession)
+                .where(ClassSession.session_type == class_type, ClassSession.is_active == True)
+                .values(current_enrollment=ClassSession.current_enrollment + new_count)
+            )
+        db.session.commit()
+        clear_dashboard_stats()
+    
+    flash(f'{sum(new_per_class.values())} contacts enrolled', 'success')
+    return redirect(request.referrer or url_for('admin_contacts'))
+
 @app.route('/admin/contacts/<int:contact_id>/delete', methods=['POST'])
-@login_required
 def delete_contact(contact_id):
-    from models import Contact
-    
-    contact = Contact.query.get_or_404(contact_id)
-    db.session.delete(contact)
+    if delete_by_id(Contact, contact_id) is None:
+        abort(404)
     db.session.commit()
+    clear_dashboard_stats()
     
     flash('Message deleted successfully', 'success')
     return redirect(url_for('admin_contacts'))
 
 @app.route('/admin/classes')
-@login_required
 def admin_classes():
-    from models import ClassSession, Contact
-    
     # Get active sessions
     active_sessions = ClassSession.query.filter_by(is_active=True).order_by(ClassSession.start_date).all()
     
     # Get inactive sessions
     inactive_sessions = ClassSession.query.filter_by(is_active=False).order_by(ClassSession.start_date.desc()).all()
     
-    # Get sessions by type
-    fall_sessions = ClassSession.query.filter_by(session_type='fall', is_active=True).order_by(ClassSession.start_date).all()
-    spring_sessions = ClassSession.query.filter_by(session_type='spring', is_active=True).order_by(ClassSession.start_date).all()
+    # Split the active sessions by type (already ordered by start date)
+    fall_sessions = [session for session in active_sessions if session.session_type == 'fall']
+    spring_sessions = [session for session in active_sessions if session.session_type == 'spring']
     
-    # Get contacts by class assignment
-    fall_contacts = Contact.query.filter_by(class_assignment='fall').count()
-    spring_contacts = Contact.query.filter_by(class_assignment='spring').count()
+    # Contact counts by class assignment come from the cached dashboard aggregate
+    stats = get_dashboard_stats(db.session)
     
     # Get enrolled students by class type
-    fall_enrolled = Contact.query.filter_by(class_assignment='fall', is_enrolled=True).all()
-    spring_enrolled = Contact.query.filter_by(class_assignment='spring', is_enrolled=True).all()
+    fall_enrolled, spring_enrolled = load_enrolled_students(db.session)
     
-    # Count enrolled students
-    fall_enrolled_count = len(fall_enrolled)
-    spring_enrolled_count = len(spring_enrolled)
-    
-    response = make_response(render_template(
+    return render_template(
         'admin/classes.html',
         active_sessions=active_sessions,
         inactive_sessions=inactive_sessions,
         fall_sessions=fall_sessions,
         spring_sessions=spring_sessions,
-        fall_contacts=fall_contacts,
-        spring_contacts=spring_contacts,
+        fall_contacts=stats['fall_contacts'],
+        spring_contacts=stats['spring_contacts'],
         fall_enrolled=fall_enrolled,
         spring_enrolled=spring_enrolled,
-        fall_enrolled_count=fall_enrolled_count,
-        spring_enrolled_count=spring_enrolled_count
-    ))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+        fall_enrolled_count=len(fall_enrolled),
+        spring_enrolled_count=len(spring_enrolled)
+    )
+
+def to_cents(amount):
+    """Convert a dollar amount from a form field to integer cents without float rounding"""
+    return int(Decimal(str(amount)).scaleb(2).to_integral_value())
 
 @app.route('/admin/classes/add', methods=['GET', 'POST'])
-@login_required
 def add_class():
-    from models import ClassSession
-    
     if request.method == 'POST':
         try:
             # Convert dates from string to Date objects
-            start_date = datetime.strptime(request.form.get('start_date'), '%Y-%m-%d').date()
-            end_date = datetime.strptime(request.form.get('end_date'), '%Y-%m-%d').date()
+            start_date = date.fromisoformat(request.form.get('start_date'))
+            end_date = date.fromisoformat(request.form.get('end_date'))
             
             # Handle early bird deadline (optional)
             early_bird_deadline = None
             if request.form.get('early_bird_deadline'):
-                early_bird_deadline = datetime.strptime(request.form.get('early_bird_deadline'), '%Y-%m-%d').date()
+                early_bird_deadline = date.fromisoformat(request.form.get('early_bird_deadline'))
             
             # Convert prices to cents
-            price_regular = int(float(request.form.get('price_regular', 0)) * 100)
-            price_early_bird = int(float(request.form.get('price_early_bird', 0)) * 100)
+            price_regular = to_cents(request.form.get('price_regular', 0))
+            price_early_bird = to_cents(request.form.get('price_early_bird', 0))
             
             new_session = ClassSession(
                 name=request.form.get('name'),
@@ -1315,6 +1741,7 @@ def add_class():
             
             db.session.add(new_session)
             db.session.commit()
+            clear_dashboard_stats()
             
             flash('Class session added successfully', 'success')
             return redirect(url_for('admin_classes'))
@@ -1324,31 +1751,26 @@ def add_class():
             app.logger.error(f"Error adding class session: {str(e)}")
             flash(f'Error adding class session: {str(e)}', 'danger')
     
-    response = make_response(render_template('admin/class_form.html', session=None))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    return render_template('admin/class_form.html', session=None)
 
 @app.route('/admin/classes/<int:class_id>/edit', methods=['GET', 'POST'])
-@login_required
 def edit_class(class_id):
-    from models import ClassSession
-    
-    session = ClassSession.query.get_or_404(class_id)
+    session = db.get_or_404(ClassSession, class_id)
     
     if request.method == 'POST':
         try:
             # Convert dates from string to Date objects
-            start_date = datetime.strptime(request.form.get('start_date'), '%Y-%m-%d').date()
-            end_date = datetime.strptime(request.form.get('end_date'), '%Y-%m-%d').date()
+            start_date = date.fromisoformat(request.form.get('start_date'))
+            end_date = date.fromisoformat(request.form.get('end_date'))
             
             # Handle early bird deadline (optional)
             early_bird_deadline = None
             if request.form.get('early_bird_deadline'):
-                early_bird_deadline = datetime.strptime(request.form.get('early_bird_deadline'), '%Y-%m-%d').date()
+                early_bird_deadline = date.fromisoformat(request.form.get('early_bird_deadline'))
             
             # Convert prices to cents
-            price_regular = int(float(request.form.get('price_regular', 0)) * 100)
-            price_early_bird = int(float(request.form.get('price_early_bird', 0)) * 100)
+            price_regular = to_cents(request.form.get('price_regular', 0))
+            price_early_bird = to_cents(request.form.get('price_early_bird', 0))
             
             session.name = request.form.get('name')
             session.description = request.form.get('description')
@@ -1362,6 +1784,7 @@ def edit_class(class_id):
             session.is_active = bool(request.form.get('is_active'))
             
             db.session.commit()
+            clear_dashboard_stats()
             
             flash('Class session updated successfully', 'success')
             return redirect(url_for('admin_classes'))
@@ -1371,47 +1794,31 @@ def edit_class(class_id):
             app.logger.error(f"Error updating class session: {str(e)}")
             flash(f'Error updating class session: {str(e)}', 'danger')
     
-    response = make_response(render_template('admin/class_form.html', session=session))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    return render_template('admin/class_form.html', session=session)
 
 @app.route('/admin/classes/<int:class_id>/delete', methods=['POST'])
-@login_required
 def delete_class(class_id):
-    from models import ClassSession
-    
-    session = ClassSession.query.get_or_404(class_id)
-    
-    db.session.delete(session)
+    if delete_by_id(ClassSession, class_id) is None:
+        abort(404)
     db.session.commit()
+    clear_dashboard_stats()
     
     flash('Class session deleted successfully', 'success')
     return redirect(url_for('admin_classes'))
 
 # Blog Admin routes
 @app.route('/admin/blog')
-@login_required
 def admin_blog():
-    from models import BlogPost
+    # Get all blog posts, batch-loading authors in one IN query instead of one SELECT per row
+    posts = BlogPost.query.options(selectinload(BlogPost.author)).order_by(BlogPost.created_at.desc()).all()
     
-    # Get all blog posts
-    posts = BlogPost.query.order_by(BlogPost.created_at.desc()).all()
-    
-    response = make_response(render_template(
+    return render_template(
         'admin/blog/index.html',
         posts=posts
-    ))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    )
 
 @app.route('/admin/blog/add', methods=['GET', 'POST'])
-@login_required
 def admin_add_blog_post():
-    from models import BlogPost
-    import os
-    from werkzeug.utils import secure_filename
-    import uuid
-    
     if request.method == 'POST':
         try:
             title = request.form.get('title')
@@ -1435,12 +1842,7 @@ def admin_add_blog_post():
                 
                 # Save the uploaded file
                 upload_path = os.path.join('static', 'uploads', 'blog')
-                
-                # Ensure directory exists
-                os.makedirs(upload_path, exist_ok=True)
-                
-                file_path = os.path.join(upload_path, unique_filename)
-                featured_image_file.save(file_path)
+                save_upload(featured_image_file, upload_path, unique_filename)
                 
                 # Convert path to URL format for database storage
                 featured_image = f"/static/uploads/blog/{unique_filename}"
@@ -1457,6 +1859,7 @@ def admin_add_blog_post():
             
             db.session.add(new_post)
             db.session.commit()
+            clear_rendered_pages()
             
             flash('Blog post created successfully', 'success')
             return redirect(url_for('admin_blog'))
@@ -1466,23 +1869,19 @@ def admin_add_blog_post():
             app.logger.error(f"Error adding blog post: {str(e)}")
             flash(f'Error adding blog post: {str(e)}', 'danger')
     
-    response = make_response(render_template('admin/blog/form.html', post=None))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    return render_template('admin/blog/form.html', post=None)
 
 @app.route('/admin/blog/<int:post_id>/edit', methods=['GET', 'POST'])
-@login_required
 def admin_edit_blog_post(post_id):
-    from models import BlogPost
-    import os
-    from werkzeug.utils import secure_filename
-    import uuid
-    
-    post = BlogPost.query.get_or_404(post_id)
+    post = db.get_or_404(BlogPost, post_id)
     
     if request.method == 'POST':
         try:
-            post.title = request.form.get('title')
+            # Generate new slug only if the title changed (compare before overwriting it)
+            new_title = request.form.get('title')
+            if new_title != post.title:
+                post.slug = slugify(new_title)
+            post.title = new_title
             post.content = request.form.get('content')
             post.category = request.form.get('category')
             
@@ -1501,23 +1900,15 @@ def admin_edit_blog_post(post_id):
                 
                 # Save the uploaded file
                 upload_path = os.path.join('static', 'uploads', 'blog')
-                
-                # Ensure directory exists
-                os.makedirs(upload_path, exist_ok=True)
-                
-                file_path = os.path.join(upload_path, unique_filename)
-                featured_image_file.save(file_path)
+                save_upload(featured_image_file, upload_path, unique_filename)
                 
                 # Convert path to URL format for database storage
                 post.featured_image = f"/static/uploads/blog/{unique_filename}"
             
             post.is_published = 'is_published' in request.form
             
-            # Generate new slug if title changed
-            if post.title != request.form.get('title'):
-                post.slug = slugify(post.title)
-            
-            db.session.commit();
+            db.session.commit()
+            clear_rendered_pages()
             
             flash('Blog post updated successfully', 'success')
             return redirect(url_for('admin_blog'))
@@ -1527,41 +1918,31 @@ def admin_edit_blog_post(post_id):
             app.logger.error(f"Error updating blog post: {str(e)}")
             flash(f'Error updating blog post: {str(e)}', 'danger')
     
-    response = make_response(render_template('admin/blog/form.html', post=post))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    return render_template('admin/blog/form.html', post=post)
 
 @app.route('/admin/blog/<int:post_id>/delete', methods=['POST'])
-@login_required
 def admin_delete_blog_post(post_id):
-    from models import BlogPost
-    
-    post = BlogPost.query.get_or_404(post_id)
-    db.session.delete(post)
+    if delete_by_id(BlogPost, post_id) is None:
+        abort(404)
     db.session.commit()
+    clear_rendered_pages()
     
     flash('Blog post deleted successfully', 'success')
     return redirect(url_for('admin_blog'))
 
 # Admin Bookings Management
 @app.route('/admin/bookings', methods=['GET'])
-@login_required
 def admin_bookings():
     """Admin route to manage info session bookings"""
-    from models import InfoSessionBooking
-    
     # Get all bookings ordered by created date (newest first)
     bookings = InfoSessionBooking.query.order_by(InfoSessionBooking.created_at.desc()).all()
     
     return render_template('admin/bookings.html', bookings=bookings)
 
 @app.route('/admin/booking/<int:booking_id>', methods=['GET'])
-@login_required
 def admin_get_booking(booking_id):
     """Get details for a specific booking"""
-    from models import InfoSessionBooking
-    
-    booking = InfoSessionBooking.query.get_or_404(booking_id)
+    booking = db.get_or_404(InfoSessionBooking, booking_id)
     
     # Return JSON response with booking details
     return jsonify({
@@ -1584,12 +1965,9 @@ def admin_get_booking(booking_id):
     })
 
 @app.route('/admin/booking/<int:booking_id>/notes', methods=['POST'])
-@login_required
 def admin_update_booking_notes(booking_id):
     """Update admin notes for a booking"""
-    from models import InfoSessionBooking
-    
-    booking = InfoSessionBooking.query.get_or_404(booking_id)
+    booking = db.get_or_404(InfoSessionBooking, booking_id)
     booking.admin_notes = request.form.get('admin_notes', '')
     
     db.session.commit()
@@ -1600,12 +1978,9 @@ def admin_update_booking_notes(booking_id):
     })
 
 @app.route('/admin/booking/<int:booking_id>/status', methods=['POST'])
-@login_required
 def admin_update_booking_status(booking_id):
     """Update status for a booking"""
-    from models import InfoSessionBooking
-    
-    booking = InfoSessionBooking.query.get_or_404(booking_id)
+    booking = db.get_or_404(InfoSessionBooking, booking_id)
     new_status = request.form.get('status')
     
     if new_status in ['Pending', 'Contacted', 'Zoom Sent', 'Completed', 'Cancelled']:
@@ -1629,69 +2004,50 @@ def admin_update_booking_status(booking_id):
     })
 
 @app.route('/admin/booking/<int:booking_id>/delete', methods=['GET'])
-@login_required
 def admin_delete_booking(booking_id):
     """Delete a booking"""
-    from models import InfoSessionBooking
-    
-    booking = InfoSessionBooking.query.get_or_404(booking_id)
-    
-    db.session.delete(booking)
+    booking = delete_by_id(InfoSessionBooking, booking_id, InfoSessionBooking.name)
+    if booking is None:
+        abort(404)
     db.session.commit()
     
     flash(f'Booking for {booking.name} has been deleted', 'success')
     return redirect(url_for('admin_bookings'))
 
 @app.route('/admin/bookings/export', methods=['GET'])
-@login_required
 def admin_export_bookings():
     """Export bookings data as CSV"""
-    from models import InfoSessionBooking
-    import csv
-    from io import StringIO
-    
-    # Get all bookings
-    bookings = InfoSessionBooking.query.order_by(InfoSessionBooking.created_at.desc()).all()
-    
-    # Create CSV file
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow(['ID', 'Name', 'Email', 'Phone', 'Preferred Date', 'Preferred Time', 
-                    'Comments', 'Status', 'Created At', 'Admin Notes', 'Zoom Link Sent', 'Zoom Link Sent At'])
-    
-    # Write data
-    for booking in bookings:
-        writer.writerow([
+    # Fetch in batches so memory stays flat however many bookings there are
+    bookings = InfoSessionBooking.query.order_by(InfoSessionBooking.created_at.desc()).yield_per(200)
+    rows = (
+        [
             booking.id,
             booking.name,
             booking.email,
             booking.phone,
             booking.formatted_date,
             booking.formatted_time,
-            booking.comments,
+            # Free text typed by visitors or staff can't be left to open as a spreadsheet formula
+            csv_escape_formula(booking.comments),
             booking.status,
             booking.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            booking.admin_notes,
+            csv_escape_formula(booking.admin_notes),
             'Yes' if booking.zoom_link_sent else 'No',
             booking.zoom_link_sent_at.strftime('%Y-%m-%d %H:%M:%S') if booking.zoom_link_sent_at else ''
-        ])
-    
-    # Create response
-    response = make_response(output.getvalue())
-    response.headers['Content-Disposition'] = 'attachment; filename=bookings.csv'
-    response.headers['Content-type'] = 'text/csv'
+        ]
+        for booking in bookings
+    )
     
-    return response
+    return stream_csv(
+        'bookings.csv',
+        ['ID', 'Name', 'Email', 'Phone', 'Preferred Date', 'Preferred Time',
+         'Comments', 'Status', 'Created At', 'Admin Notes', 'Zoom Link Sent', 'Zoom Link Sent At'],
+        rows
+    )
 
 @app.route('/admin/send-zoom-link', methods=['POST'])
-@login_required
 def admin_send_zoom_link():
     """Send zoom link to a booking contact"""
-    from models import InfoSessionBooking
-    from utils.email import send_zoom_link_email
-    
     booking_id = request.form.get('booking_id')
     email = request.form.get('email')
     zoom_link = request.form.get('zoom_link')
@@ -1709,7 +2065,7 @@ def admin_send_zoom_link():
     
     # Parse date and time
     try:
-        session_date = datetime.strptime(session_date_str, '%Y-%m-%d').date()
+        session_date = date.fromisoformat(session_date_str)
         session_time = datetime.strptime(session_time_str, '%H:%M').time()
     except ValueError:
         return jsonify({
@@ -1718,7 +2074,7 @@ def admin_send_zoom_link():
         })
     
     # Get booking
-    booking = InfoSessionBooking.query.get(booking_id)
+    booking = db.session.get(InfoSessionBooking, booking_id)
     
     if booking:
         # Get recipient name
@@ -1762,11 +2118,8 @@ def admin_send_zoom_link():
     return render_template('admin/settings.html', settings_by_category=settings_by_category)
 
 @app.route('/admin/settings/seed', methods=['POST'])
-@login_required
 def admin_seed_settings():
     """Seed default settings"""
-    from models import SiteSetting
-    
     default_settings = [
         # Dates and Timers
         ('early_bird_deadline', '2025-12-31 23:59:59', 'datetime', 'Early bird offer deadline', 'dates'),
@@ -1859,25 +2212,32 @@ def admin_seed_settings():
         ('facebook_url', 'https://www.facebook.com/people/Future-Accountants-Coaching-Training-Service/61574242315278/', 'text', 'Facebook page URL', 'contact'),
     ]
     
-    for key, value, value_type, description, category in default_settings:
-        existing = SiteSetting.query.filter_by(key=key).first()
-        if not existing:
-            setting = SiteSetting(
-                key=key,
-                value=value,
-                value_type=value_type,
-                description=description,
-                category=category,
-                updated_by=current_user.id
-            )
-            db.session.add(setting)
+    # Look up which defaults already exist with a single IN query
+    existing_keys = {
+        key for (key,) in db.session.query(SiteSetting.key).filter(
+            SiteSetting.key.in_([setting[0] for setting in default_settings])
+        )
+    }
+    
+    db.session.bulk_insert_mappings(SiteSetting, [
+        {
+            'key': key,
+            'value': value,
+            'value_type': value_type,
+            'description': description,
+            'category': category,
+            'updated_by': current_user.id
+        }
+        for key, value, value_type, description, category in default_settings
+        if key not in existing_keys
+    ])
     
     db.session.commit()
+    clear_site_settings()
     flash('Default settings seeded successfully', 'success')
     return redirect(url_for('admin_settings'))
 
 @app.route('/admin/upload-media', methods=['POST'])
-@login_required
 def admin_upload_media():
     """Handle media file uploads from admin panel"""
     if 'file' not in request.files:
@@ -1904,20 +2264,14 @@ def admin_upload_media():
         else:
             upload_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'images')
         
-        # Create directory if it doesn't exist
-        os.makedirs(upload_dir, exist_ok=True)
-        
         # Save file with unique name to prevent conflicts
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         name, ext = os.path.splitext(filename)
-        unique_filename = f"{name}_{timestamp}{ext}"
-        file_path = os.path.join(upload_dir, unique_filename)
+        unique_filename = f"{name}_{uuid.uuid4().hex}{ext}"
         
         try:
-            file.save(file_path)
+            save_upload(file, upload_dir, unique_filename)
             
             # Update the site setting with the new filename
-            from models import SiteSetting
             setting = SiteSetting.query.filter_by(key=setting_key).first()
             
             if setting:
@@ -1925,6 +2279,7 @@ def admin_upload_media():
                 setting.updated_by = current_user.id
                 setting.updated_at = datetime.utcnow()
                 db.session.commit()
+                clear_site_settings()
                 
                 return jsonify({
                     'success': True, 
@@ -1942,10 +2297,7 @@ def admin_upload_media():
 
 # Info Session Emails Admin
 @app.route('/admin/info-sessions')
-@login_required
 def admin_info_sessions():
-    from models import InfoSessionEmail, InfoSession
-    
     # Get all info session emails
     emails = InfoSessionEmail.query.order_by(InfoSessionEmail.created_at.desc()).all()
     
@@ -1963,7 +2315,7 @@ def admin_info_sessions():
     
     reminder_sent_count = InfoSessionEmail.query.filter_by(reminder_sent=True).count()
     
-    response = make_response(render_template(
+    return render_template(
         'admin/info_sessions.html',
         emails=emails,
         active_sessions=active_sessions,
@@ -1974,17 +2326,11 @@ def admin_info_sessions():
         zoom_sent_count=zoom_sent_count,
         zoom_not_sent_count=zoom_not_sent_count,
         reminder_sent_count=reminder_sent_count
-    ))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    )
 
 # Site Analytics Dashboard
 @app.route('/admin/analytics')
-@login_required
 def admin_analytics():
-    from models import PageView, ButtonClick, VisitorLocation, ReferralSource, SessionDuration
-    from sqlalchemy import func, extract, distinct
-    
     # Time filtering
     time_filter = request.args.get('time', 'all')
     date_filter = None
@@ -2132,7 +2478,7 @@ def admin_analytics():
         # day.date is a date string from func.date(), need to parse it
         try:
             if isinstance(day.date, str):
-                date_obj = datetime.strptime(day.date, '%Y-%m-%d').date()
+                date_obj = date.fromisoformat(day.date)
             else:
                 date_obj = day.date
             chart_labels.append(date_obj.strftime('%b %d'))
@@ -2200,7 +2546,7 @@ def admin_analytics():
         browser_name = browser.browser or 'Unknown'
         browser_data[browser_name] = browser.visitors
     
-    response = make_response(render_template(
+    return render_template(
         'admin/analytics.html',
         total_page_views=total_page_views,
         total_visitors=total_visitors,
@@ -2216,28 +2562,65 @@ def admin_analytics():
         device_data=device_data,
         browser_data=browser_data,
         time_filter=time_filter
-    ))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    )
+
+def delete_info_session_emails(email_ids):
+    """Delete the given info session emails in one statement and return how many went"""
+    result = db.session.execute(delete(InfoSessionEmail).where(InfoSessionEmail.id.in_(email_ids)))
+    db.session.commit()
+    return result.rowcount
+
+def bulk_add_info_session_emails(rows):
+    """Insert many info session emails in one batched INSERT and one commit; returns how many were new"""
+    # Addresses that are already registered are skipped by the database rather than checked one by one
+    result = db.session.execute(
+        insert_or_ignore(InfoSessionEmail, ['email']).returning(InfoSessionEmail.id),
+        rows
+    )
+    added = len(result.all())
+    db.session.commit()
+    return added
+
+@app.route('/admin/info-sessions/import', methods=['POST'])
+def admin_import_info_session_emails():
+    # One address per line; commas and semicolons also separate addresses
+    raw = re.split(r'[\s,;]+', request.form.get('emails', ''))
+    emails = list(dict.fromkeys(email for email in raw if '@' in email))
+    
+    if not emails:
+        flash('Please provide at least one email address', 'danger')
+        return redirect(url_for('admin_info_sessions'))
+    
+    try:
+        added = bulk_add_info_session_emails(
+            [{'email': email, 'confirmation_status': 'pending'} for email in emails]
+        )
+        flash(f'{added} emails imported ({len(emails) - added} already registered)', 'success')
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"Error importing info session emails: {str(e)}")
+        flash(f'Error importing emails: {str(e)}', 'danger')
+    
+    return redirect(url_for('admin_info_sessions'))
+
+@app.route('/admin/info-sessions/delete', methods=['POST'])
+def admin_delete_info_session_emails():
+    email_ids = request.form.getlist('ids', type=int)
+    deleted = delete_info_session_emails(email_ids) if email_ids else 0
+    
+    flash(f'{deleted} emails deleted successfully', 'success')
+    return redirect(url_for('admin_info_sessions'))
 
 @app.route('/admin/info-sessions/<int:email_id>/delete', methods=['POST'])
-@login_required
 def admin_delete_info_session_email(email_id):
-    from models import InfoSessionEmail
-    
-    email = InfoSessionEmail.query.get_or_404(email_id)
-    db.session.delete(email)
-    db.session.commit()
+    if not delete_info_session_emails([email_id]):
+        abort(404)
     
     flash('Email deleted successfully', 'success')
     return redirect(url_for('admin_info_sessions'))
 
 @app.route('/admin/email-logs')
-@login_required
 def admin_email_logs():
-    # Import EmailLog model
-    from models import EmailLog
-    
     # Get parameters
     page = request.args.get('page', 1, type=int)
     status = request.args.get('status')
@@ -2260,56 +2643,53 @@ def admin_email_logs():
     failed_count = EmailLog.query.filter_by(status='failed').count()
     total_count = EmailLog.query.count()
     
-    response = make_response(render_template(
+    return render_template(
         'admin/email_logs.html',
         logs=logs,
         status=status,
         success_count=success_count,
         failed_count=failed_count,
         total_count=total_count
-    ))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    )
 
 @app.route('/admin/info-sessions/export', methods=['GET'])
-@login_required
 def admin_export_info_session_emails():
-    from models import InfoSessionEmail
-    import csv
-    from io import StringIO
-    
-    emails = InfoSessionEmail.query.order_by(InfoSessionEmail.created_at.desc()).all()
-    
-    # Create CSV in memory
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Write header row
-    writer.writerow(['Email', 'Date Registered', 'Confirmation Status', 'Zoom Link Sent', 'Reminder Sent', 'Notes'])
-    
-    # Write data rows
-    for email in emails:
-        writer.writerow([
-            email.email,
-            email.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-            email.confirmation_status,
-            'Yes' if email.zoom_link_sent else 'No',
-            'Yes' if email.reminder_sent else 'No',
-            email.notes or ''
-        ])
-    
-    # Create response with CSV data
-    response = make_response(output.getvalue())
-    response.headers['Content-Disposition'] = 'attachment; filename=info_session_emails.csv'
-    response.headers['Content-type'] = 'text/csv'
+    # Let the database format the timestamp so each row is copied straight through
+    if db.engine.dialect.name == 'sqlite':
+        created_at = func.strftime('%Y-%m-%d %H:%M:%S', InfoSessionEmail.created_at)
+    else:
+        created_at = func.to_char(InfoSessionEmail.created_at, 'YYYY-MM-DD HH24:MI:SS')
+    
+    # Plain column tuples: the export never touches the ORM objects themselves
+    emails = db.session.execute(
+        select(
+            InfoSessionEmail.email,
+            created_at,
+            InfoSessionEmail.confirmation_status,
+            InfoSessionEmail.zoom_link_sent,
+            InfoSessionEmail.reminder_sent,
+            InfoSessionEmail.notes
+        )
+        .order_by(InfoSessionEmail.created_at.desc())
+        .execution_options(yield_per=200)
+    )
+    # Fixed schema, so format each line directly; only the free-text columns can need quoting
+    rows = (
+        f"{csv_field(email)},{created_at or ''},{csv_field(confirmation_status or '')},"
+        f"{'Yes' if zoom_link_sent else 'No'},{'Yes' if reminder_sent else 'No'},"
+        f"{csv_field(csv_escape_formula(notes or ''))}\r\n"
+        for email, created_at, confirmation_status, zoom_link_sent, reminder_sent, notes in emails
+    )
     
-    return response
+    return stream_csv(
+        'info_session_emails.csv',
+        ['Email', 'Date Registered', 'Confirmation Status', 'Zoom Link Sent', 'Reminder Sent', 'Notes'],
+        rows,
+        preformatted=True
+    )
 
 @app.route('/admin/info-sessions/manage', methods=['GET', 'POST'])
-@login_required
 def admin_manage_info_sessions():
-    from models import InfoSession
-    
     # Get all info sessions
     sessions = InfoSession.query.order_by(InfoSession.date.desc()).all()
     
@@ -2332,7 +2712,7 @@ def admin_manage_info_sessions():
                 return redirect(url_for('admin_manage_info_sessions'))
             
             # Convert date and time strings to date and time objects
-            session_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            session_date = date.fromisoformat(date_str)
             session_time = datetime.strptime(time_str, '%H:%M').time()
             
             # Create new info session
@@ -2362,11 +2742,8 @@ def admin_manage_info_sessions():
     return render_template('admin/info_session_manage.html', sessions=sessions)
 
 @app.route('/admin/info-sessions/<int:session_id>/edit', methods=['GET', 'POST'])
-@login_required
 def admin_edit_info_session(session_id):
-    from models import InfoSession
-    
-    session = InfoSession.query.get_or_404(session_id)
+    session = db.get_or_404(InfoSession, session_id)
     
     if request.method == 'POST':
         try:
@@ -2382,7 +2759,7 @@ def admin_edit_info_session(session_id):
             session.is_active = bool(request.form.get('is_active'))
             
             # Convert date and time strings to date and time objects
-            session.date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            session.date = date.fromisoformat(date_str)
             session.time = datetime.strptime(time_str, '%H:%M').time()
             
             db.session.commit()
@@ -2398,27 +2775,24 @@ def admin_edit_info_session(session_id):
     return render_template('admin/info_session_form.html', session=session)
 
 @app.route('/admin/info-sessions/<int:session_id>/delete', methods=['POST'])
-@login_required
 def admin_delete_info_session(session_id):
-    from models import InfoSession
-    
-    session = InfoSession.query.get_or_404(session_id)
-    
     try:
-        db.session.delete(session)
+        deleted = delete_by_id(InfoSession, session_id)
         db.session.commit()
-        
-        flash('Info session deleted successfully', 'success')
     except Exception as e:
+        db.session.rollback()
         app.logger.error(f"Error deleting info session: {str(e)}")
         flash(f'Error deleting info session: {str(e)}', 'danger')
+        return redirect(url_for('admin_manage_info_sessions'))
     
+    if deleted is None:
+        abort(404)
+    
+    flash('Info session deleted successfully', 'success')
     return redirect(url_for('admin_manage_info_sessions'))
 
 @app.route('/admin/info-sessions/send-zoom-links', methods=['POST'])
-@login_required
 def admin_send_zoom_links():
-    from models import InfoSession
     from utils.email import send_zoom_link_to_all
     
     try:
@@ -2431,7 +2805,7 @@ def admin_send_zoom_links():
             return redirect(url_for('admin_info_sessions'))
         
         # Get the info session
-        info_session = InfoSession.query.get_or_404(session_id)
+        info_session = db.get_or_404(InfoSession, session_id)
         
         # Send the zoom links
         success_count, failure_count, total_count = send_zoom_link_to_all(info_session, custom_message)
@@ -2448,20 +2822,19 @@ def admin_send_zoom_links():
     return redirect(url_for('admin_info_sessions'))
 
 @app.route('/admin/info-sessions/send-reminder/<int:session_id>', methods=['POST'])
-@login_required
 def admin_send_reminder(session_id):
-    from models import InfoSession, InfoSessionEmail
     from utils.email import send_reminder_email
     
     try:
         # Get the info session
-        info_session = InfoSession.query.get_or_404(session_id)
+        info_session = db.get_or_404(InfoSession, session_id)
         
         # Get all info session emails with zoom links sent
         emails = InfoSessionEmail.query.filter_by(zoom_link_sent=True, reminder_sent=False).all()
         
         success_count = 0
         failure_count = 0
+        now = datetime.now()
         
         for email in emails:
             # Send reminder email
@@ -2470,7 +2843,7 @@ def admin_send_reminder(session_id):
             if email_sent:
                 # Update the email record
                 email.reminder_sent = True
-                email.reminder_sent_at = datetime.now()
+                email.reminder_sent_at = now
                 success_count += 1
             else:
                 failure_count += 1
@@ -2605,7 +2978,6 @@ def chat():
 @app.route('/tasks/send-auto-reminders', methods=['GET'])
 def send_auto_reminders():
     # This endpoint would be called by a scheduler (e.g., cron job) to automatically send reminders
-    from models import InfoSession, InfoSessionEmail
     from utils.email import send_reminder_email
     
     # Check for authentication token if this is publicly accessible
@@ -2658,10 +3030,8 @@ def send_auto_reminders():
 
 # Admin Settings Management
 @app.route('/admin/settings')
-@login_required
 def admin_settings():
     """Admin route to manage site settings"""
-    from models import SiteSetting
      # Get all settings organized by category
     all_settings = SiteSetting.query.all()
     pricing_settings = SiteSetting.query.filter(SiteSetting.key.like('%price%')).all()
@@ -2695,35 +3065,37 @@ def admin_settings():
         )
     ).all()
 
-    response = make_response(render_template(
+    return render_template(
         'admin/settings.html',
         all_settings=all_settings,
         pricing_settings=pricing_settings,
         date_settings=date_settings,
         content_settings=content_settings,
         general_settings=general_settings
-    ))
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    return response
+    )
 
 @app.route('/admin/settings/update', methods=['POST'])
-@login_required
 def admin_update_settings():
     """Update site settings"""
-    from models import SiteSetting
-    
     try:
         # Get all form data
-        for key, value in request.form.items():
-            if key.startswith('setting_'):
-                setting_key = key[8:]  # Remove 'setting_' prefix
-                setting = SiteSetting.query.filter_by(key=setting_key).first()
-                
-                if setting:
-                    setting.value = value
-                    db.session.add(setting)
+        submitted = {
+            key[8:]: value  # Remove 'setting_' prefix
+            for key, value in request.form.items()
+            if key.startswith('setting_')
+        }
+        
+        # Resolve submitted keys to ids with a single IN query, then write them in one batch
+        if submitted:
+            now = datetime.utcnow()
+            rows = db.session.query(SiteSetting.id, SiteSetting.key).filter(SiteSetting.key.in_(submitted))
+            db.session.bulk_update_mappings(SiteSetting, [
+                {'id': setting_id, 'value': submitted[key], 'updated_at': now}
+                for setting_id, key in rows
+            ])
         
         db.session.commit()
+        clear_site_settings()
         flash('Settings updated successfully!', 'success')
         
     except Exception as e:
@@ -2734,13 +3106,13 @@ def admin_update_settings():
     return redirect(url_for('admin_settings'))
 
 @app.route('/admin/settings/reset', methods=['POST'])
-@login_required
 def admin_reset_settings():
     """Reset all settings to defaults"""
     try:
         # Run the initialization script programmatically
         from init_site_settings import initialize_site_settings
         initialize_site_settings(reset=True)
+        clear_site_settings()
         
         flash('Settings reset to defaults successfully!', 'success')
         
@@ -52,7 +52,7 @@ def create_app(config_name=None):
     @login_manager.user_loader
     def load_user(user_id):
         from models import Admin
-        return Admin.query.get(int(user_id))
+        return db.session.get(Admin, int(user_id))
     
     # Setup logging
     setup_logging(app)
@@ -66,8 +66,10 @@ def create_app(config_name=None):
     # Register template filters and context processors
     register_template_helpers(app)
     
-    # Create database tables
-    with app.app_context():
+    # Schema setup runs once per deploy via `flask init-db`, not in every worker
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create database tables and the default admin"""
         db.create_all()
         create_default_admin()
     
@@ -141,7 +143,7 @@ def create_default_admin():
     try:
         from models import Admin
         
-        if not Admin.query.first():
+        if not db.session.query(Admin.query.exists()).scalar():
             admin = Admin(
                 username='admin',
                 email='admin@facts.com',
@@ -0,0 +1,53 @@
+import os
+import tempfile
+
+import pytest
+
+# Stand-alone check scripts, run directly with python rather than collected
+collect_ignore = ['test_deadline.py', 'test_improvements.py']
+
+# app.py reads DATABASE_URL at import time, so point it at a throwaway SQLite file first
+_db_fd, _db_path = tempfile.mkstemp(suffix='.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{_db_path}'
+
+import app as app_module  # noqa: E402
+from app import app as flask_app  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Admin  # noqa: E402
+
+
+@pytest.fixture
+def app(monkeypatch):
+    # Keep request hooks from starting the analytics writer thread against tables the test drops
+    monkeypatch.setattr(app_module, 'queue_analytics', lambda event: None)
+    flask_app.config.update(TESTING=True)
+    with flask_app.app_context():
+        db.create_all()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def admin_client(app):
+    """Test client with an admin already logged in"""
+    admin = Admin(username='tester', email='tester@example.com')
+    admin.set_password('correct horse')
+    db.session.add(admin)
+    db.session.commit()
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(admin.id)
+        session['_fresh'] = True
+    return client
+
+
+def pytest_sessionfinish(session, exitstatus):
+    os.close(_db_fd)
+    os.unlink(_db_path)
@@ -0,0 +1,12 @@
+"""
+Shared extension instances, kept apart from app.py so models can import them directly
+"""
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import DeclarativeBase
+
+# Define the base class for SQLAlchemy models
+class Base(DeclarativeBase):
+    pass
+
+# Create SQLAlchemy instance
+db = SQLAlchemy(model_class=Base)
@@ -1,33 +1,65 @@
 import os
+import click
 from app import app, db  # noqa: F401
 
-# Create database tables within the application context
-with app.app_context():
+def init_db():
+    """Create database tables and the initial admin user if none exists"""
     # Import models to ensure they're registered with SQLAlchemy
-    import models
+    import models  # noqa: F401
+    db.create_all()
+    # create_all skips tables that already exist, so add any indexes declared since
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+    app.logger.info("Database tables created")
+    
+    # Create initial admin user if none exists
+    from models import Admin
+    if not db.session.query(Admin.query.exists()).scalar():
+        # Precomputed once with werkzeug's generate_password_hash, so no plaintext in source and no KDF here
+        password_hash = os.environ.get('ADMIN_BOOTSTRAP_HASH')
+        if not password_hash:
+            # Without a seeded admin nobody can sign in to /admin, so fail the deploy instead of warning
+            raise RuntimeError('No admin user exists and ADMIN_BOOTSTRAP_HASH is not set')
+        admin = Admin(
+            username='darshan',
+            email='fatrainingservice@gmail.com',
+            password_hash=password_hash
+        )
+        db.session.add(admin)
+        db.session.commit()
+        app.logger.info('Initial admin user created: darshan')
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create tables and seed the initial admin (run once per deploy)"""
     try:
-        db.create_all()
-        app.logger.info("Database tables created")
-        
-        # Create initial admin user if none exists
-        from models import Admin
-        if Admin.query.count() == 0:
-            admin = Admin(
-                username='darshan',
-                email='fatrainingservice@gmail.com'
-            )
-            admin.set_password('Kathmandu1')
-            db.session.add(admin)
-            db.session.commit()
-            app.logger.info('Initial admin user created: darshan / Kathmandu1')
-            
-    except Exception as e:
-        app.logger.error(f"Error setting up database: {e}")
-        # Continue anyway for development
+        init_db()
+    except RuntimeError as e:
+        # ClickException exits with status 1, so the deploy build step fails
+        raise click.ClickException(str(e))
+    print("Database initialized")
+
+# Workers skip schema setup unless explicitly asked; deploys run `flask --app main init-db` once (see .replit)
+if os.environ.get('FACTS_BOOTSTRAP') == '1':
+    with app.app_context():
+        try:
+            init_db()
+        except Exception as e:
+            app.logger.error(f"Error setting up database: {e}")
+            # Continue anyway for development
 
-# Set debug to False in production environment
+# Local development server only; deployments run gunicorn (see .replit)
 if __name__ == "__main__":
-    debug_mode = os.environ.get('FLASK_ENV') != 'production'
+    # The debugger and reloader stay off unless development is asked for explicitly
+    debug_mode = os.environ.get('FLASK_ENV') == 'development'
     print(f"Starting F.A.C.T.S application in {'development' if debug_mode else 'production'} mode")
     print(f"Visit: http://localhost:5000")
+    # A single local process can set up its own schema (the import-time block above already did if FACTS_BOOTSTRAP=1)
+    if os.environ.get('FACTS_BOOTSTRAP') != '1':
+        with app.app_context():
+            try:
+                init_db()
+            except Exception as e:
+                app.logger.error(f"Error setting up database: {e}")
     app.run(host="0.0.0.0", port=5000, debug=debug_mode)
@@ -1,4 +1,4 @@
-from app import db
+from extensions import db
 from datetime import datetime, timedelta, date, time
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
@@ -26,38 +26,43 @@ class SiteSetting(db.Model):
     @property
     def parsed_value(self):
         """Return the value parsed according to its type"""
-        if not self.value:
+        return self.parse_value(self.value, self.value_type)
+    
+    @staticmethod
+    def parse_value(value, value_type):
+        """Parse a raw setting value according to its type"""
+        if not value:
             return None
             
-        if self.value_type == 'date':
+        if value_type == 'date':
             try:
-                return datetime.strptime(self.value, '%Y-%m-%d').date()
+                return datetime.strptime(value, '%Y-%m-%d').date()
             except ValueError:
                 return None
-        elif self.value_type == 'datetime':
+        elif value_type == 'datetime':
             try:
                 # Handle ISO format first (2025-07-31T23:59:59)
-                if 'T' in self.value:
-                    return datetime.fromisoformat(self.value)
+                if 'T' in value:
+                    return datetime.fromisoformat(value)
                 else:
                     # Handle standard format (2025-07-31 23:59:59)
-                    return datetime.strptime(self.value, '%Y-%m-%d %H:%M:%S')
+                    return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
             except ValueError:
                 return None
-        elif self.value_type == 'number':
+        elif value_type == 'number':
             try:
-                return float(self.value) if '.' in self.value else int(self.value)
+                return float(value) if '.' in value else int(value)
             except ValueError:
                 return 0
-        elif self.value_type == 'boolean':
-            return self.value.lower() in ('true', '1', 'yes', 'on')
-        elif self.value_type == 'json':
+        elif value_type == 'boolean':
+            return value.lower() in ('true', '1', 'yes', 'on')
+        elif value_type == 'json':
             try:
-                return json.loads(self.value)
+                return json.loads(value)
             except (json.JSONDecodeError, TypeError):
                 return {}
         else:  # text
-            return self.value
+            return value
 
 
 class InfoSessionBooking(db.Model):
@@ -110,6 +115,16 @@ class Contact(db.Model):
     phone = db.Column(db.String(20))  # Phone number for enrolled students
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
+    __table_args__ = (
+        # Serves the admin inbox ordering (unread first, newest first)
+        db.Index('ix_contacts_is_read_created_at', is_read, created_at.desc()),
+        # Small partial index for the unread badge count
+        db.Index('ix_contacts_unread', id,
+                 postgresql_where=(is_read == False), sqlite_where=(is_read == False)),
+        # Enrolled students per class
+        db.Index('ix_contacts_class_enrolled', class_assignment, is_enrolled),
+    )
+
     def __repr__(self):
         return f'<Contact {self.name}>'
 
@@ -182,6 +197,10 @@ class ClassSession(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('ix_class_sessions_active_type', is_active, session_type),
+    )
+    
     # Get all enrolled students for this class session
     @property
     def enrolled_students(self):
@@ -251,6 +270,12 @@ class BlogPost(db.Model):
     # Define relationship with Admin
     author = db.relationship('Admin', backref=db.backref('blog_posts', lazy=True))
     
+    __table_args__ = (
+        # Published posts newest first, overall and within a category (related posts)
+        db.Index('ix_blog_posts_published_created_at', is_published, created_at.desc()),
+        db.Index('ix_blog_posts_published_category_created_at', is_published, category, created_at.desc()),
+    )
+    
     def __init__(self, *args, **kwargs):
         # If slug isn't provided, generate it from title
         if 'slug' not in kwargs and 'title' in kwargs:
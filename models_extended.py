@@ -1,7 +1,7 @@
 """
 Enhanced models for user management and course enrollment
 """
-from app import db
+from extensions import db
 from datetime import datetime
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
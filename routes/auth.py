@@ -6,10 +6,20 @@ from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import check_password_hash, generate_password_hash
 from models_extended import User
 from app import db
+from datetime import datetime, timedelta
+from functools import lru_cache
 import re
+import secrets
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
+LAST_LOGIN_RESOLUTION = timedelta(hours=1)  # last_login is informational, so hourly precision is enough
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash():
+    """Hash checked for unknown emails so they cost the same as a wrong password"""
+    return generate_password_hash(secrets.token_hex(16))
+
 @auth_bp.route('/register', methods=['GET', 'POST'])
 def register():
     """User registration"""
@@ -85,6 +95,9 @@ def login():
             return render_template('auth/login.html')
         
         user = User.query.filter_by(email=email).first()
+        if user is None:
+            # Keep timing constant whether or not the email exists
+            check_password_hash(_dummy_password_hash(), password)
         
         if user and user.check_password(password):
             if not user.is_active:
@@ -92,8 +105,10 @@ def login():
                 return render_template('auth/login.html')
             
             login_user(user, remember=remember_me)
-            user.last_login = datetime.utcnow()
-            db.session.commit()
+            now = datetime.utcnow()
+            if user.last_login is None or now - user.last_login > LAST_LOGIN_RESOLUTION:
+                user.last_login = now
+                db.session.commit()
             
             # Redirect to next page or dashboard
             next_page = request.args.get('next')
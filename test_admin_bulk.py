@@ -0,0 +1,54 @@
+from datetime import date
+
+import pytest
+
+from extensions import db
+from models import ClassSession, Contact
+
+
+@pytest.mark.parametrize('path', ['/admin/contacts/bulk-enroll'])
+def test_bulk_endpoints_require_login(client, path):
+    response = client.post(path, data={'contact_ids': ['1']})
+    assert response.status_code == 302
+    assert '/admin/login' in response.headers['Location']
+
+
+def add_class(session_type, is_active=True, current_enrollment=0):
+    class_session = ClassSession(name=f'{session_type} intake', session_type=session_type, is_active=is_active,
+                                 start_date=date(2024, 9, 1), end_date=date(2024, 11, 1),
+                                 current_enrollment=current_enrollment)
+    db.session.add(class_session)
+    return class_session
+
+
+def test_bulk_enroll_updates_current_enrollment(admin_client):
+    fall = add_class('fall', current_enrollment=2)
+    spring = add_class('spring')
+    old_fall = add_class('fall', is_active=False, current_enrollment=5)
+    blank = add_class('')
+    contacts = [
+        Contact(name='A', email='a@example.com', message='-', class_assignment='fall'),
+        Contact(name='B', email='b@example.com', message='-', class_assignment='fall'),
+        Contact(name='C', email='c@example.com', message='-', class_assignment='spring'),
+        Contact(name='D', email='d@example.com', message='-', class_assignment='fall', is_enrolled=True),
+        # No class (or an empty one), so not enrollable
+        Contact(name='E', email='e@example.com', message='-'),
+        Contact(name='F', email='f@example.com', message='-', class_assignment=''),
+    ]
+    db.session.add_all(contacts)
+    db.session.commit()
+    contact_ids = [str(contact.id) for contact in contacts]
+
+    response = admin_client.post('/admin/contacts/bulk-enroll', data={'contact_ids': contact_ids})
+    assert response.status_code == 302
+
+    db.session.expire_all()
+    assert [contact.is_enrolled for contact in contacts] == [True, True, True, True, False, False]
+    # Already-enrolled contacts, inactive sessions and blank classes are left alone
+    assert (fall.current_enrollment, spring.current_enrollment, old_fall.current_enrollment) == (4, 1, 5)
+    assert blank.current_enrollment == 0
+
+    # Posting the same ids again enrolls nobody new
+    admin_client.post('/admin/contacts/bulk-enroll', data={'contact_ids': contact_ids})
+    db.session.expire_all()
+    assert (fall.current_enrollment, spring.current_enrollment) == (4, 1)
@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+from extensions import db
+from models import Admin
+
+
+def make_admin(last_login=None):
+    admin = Admin(username='darshan', email='admin@example.com', password_hash='x', last_login=last_login)
+    db.session.add(admin)
+    db.session.commit()
+    return admin
+
+
+def test_login_signs_in_the_first_admin(client):
+    make_admin()
+    response = client.get('/admin/login')
+    assert response.status_code == 302
+    assert response.headers['Location'] == '/admin'
+    assert client.get('/admin').status_code == 200
+
+
+def test_last_login_is_written_at_most_hourly(client):
+    recent = datetime.utcnow() - timedelta(minutes=10)
+    admin = make_admin(last_login=recent)
+    client.get('/admin/login')
+    db.session.expire_all()
+    assert admin.last_login == recent
+
+    stale = datetime.utcnow() - timedelta(hours=2)
+    admin.last_login = stale
+    db.session.commit()
+    client.get('/admin/login')
+    db.session.expire_all()
+    assert admin.last_login > stale
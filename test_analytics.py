@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+from app import flush_analytics_events, write_analytics_batch
+from extensions import db
+from models import ButtonClick, PageView, SessionDuration
+
+
+def page_view(path, when):
+    return (PageView, {'path': path, 'visitor_id': 'v1', 'timestamp': when})
+
+
+def test_write_batch_inserts_rows(app):
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    write_analytics_batch([
+        page_view('/', now),
+        page_view('/about', now),
+        (ButtonClick, {'button_id': 'enroll', 'page_path': '/', 'visitor_id': 'v1', 'timestamp': now}),
+    ])
+
+    assert sorted(db.session.scalars(db.select(PageView.path))) == ['/', '/about']
+    assert db.session.scalar(db.select(db.func.count(ButtonClick.id))) == 1
+
+
+def test_session_hits_are_coalesced(app):
+    start = datetime(2024, 5, 1, 12, 0, 0)
+    write_analytics_batch([
+        (SessionDuration, {'visitor_id': 'v1', 'session_id': 's1', 'start_time': start}),
+        # Hits can arrive out of order; the latest end time wins and pages add up
+        ('session_hit', ('s1', start + timedelta(seconds=90), 1)),
+        ('session_hit', ('s1', start + timedelta(seconds=30), 1)),
+        ('session_hit', ('s1', start + timedelta(seconds=60), 0)),
+        # Hits for sessions that were never recorded are ignored
+        ('session_hit', ('missing', start, 1)),
+    ])
+
+    duration = db.session.scalars(db.select(SessionDuration)).one()
+    assert duration.end_time == start + timedelta(seconds=90)
+    assert duration.duration_seconds == 90
+    assert duration.pages_viewed == 3
+
+
+def test_bad_event_only_drops_itself(app):
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    flush_analytics_events([
+        page_view('/', now),
+        page_view(None, now),  # path is NOT NULL, so the batch insert fails
+        page_view('/contact', now),
+    ])
+
+    assert sorted(db.session.scalars(db.select(PageView.path))) == ['/', '/contact']
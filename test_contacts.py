@@ -0,0 +1,80 @@
+from extensions import db
+from models import Contact
+
+
+def make_contacts(count):
+    contacts = [Contact(name=f'Student {n}', email=f's{n}@example.com', message='Hello') for n in range(count)]
+    db.session.add_all(contacts)
+    db.session.commit()
+    return [contact.id for contact in contacts]
+
+
+def read_flags():
+    return {contact.id: contact.is_read for contact in db.session.scalars(db.select(Contact))}
+
+
+def test_mark_read_batch_json(admin_client):
+    ids = make_contacts(3)
+
+    response = admin_client.post('/admin/contacts/mark-read-batch', json={'ids': ids[:2]})
+    assert response.status_code == 200
+    assert response.get_json() == {'success': True, 'updated': 2}
+    db.session.expire_all()
+    assert read_flags() == {ids[0]: True, ids[1]: True, ids[2]: False}
+
+    response = admin_client.post('/admin/contacts/mark-read-batch', json={'ids': [ids[0]], 'is_read': False})
+    assert response.get_json() == {'success': True, 'updated': 1}
+    db.session.expire_all()
+    assert read_flags()[ids[0]] is False
+
+
+def test_mark_read_batch_rejects_bad_json(admin_client):
+    ids = make_contacts(2)
+
+    for payload in ([1, 2], {'ids': '12'}, {'ids': ['1']}, {'ids': [True]},
+                    {'ids': ids, 'is_read': 'false'}, {'ids': ids, 'is_read': 0}):
+        response = admin_client.post('/admin/contacts/mark-read-batch', json=payload)
+        assert response.status_code == 400, payload
+        assert response.get_json()['success'] is False
+
+    db.session.expire_all()
+    assert not any(read_flags().values())
+
+
+def test_mark_read_batch_form(admin_client):
+    ids = make_contacts(3)
+
+    response = admin_client.post('/admin/contacts/mark-read-batch', data={'ids': [str(ids[0]), str(ids[2])]})
+    assert response.status_code == 302
+    db.session.expire_all()
+    assert read_flags() == {ids[0]: True, ids[1]: False, ids[2]: True}
+
+
+def test_mark_read_batch_requires_login(client):
+    response = client.post('/admin/contacts/mark-read-batch', json={'ids': [1]})
+    assert response.status_code == 302
+    assert '/admin/login' in response.headers['Location']
+
+
+def test_contact_form_stores_message_before_responding(client, monkeypatch):
+    import app as app_module
+    submitted = []
+    monkeypatch.setattr(app_module.background_executor, 'submit', lambda fn, *args: submitted.append((fn, args)))
+
+    response = client.post('/contact', data={'name': 'Ann', 'email': 'ann@example.com', 'message': 'Hi'},
+                           headers={'X-Requested-With': 'XMLHttpRequest'})
+
+    assert response.get_json()['success'] is True
+    contact = db.session.scalars(db.select(Contact)).one()
+    assert (contact.name, contact.email, contact.message) == ('Ann', 'ann@example.com', 'Hi')
+    # Only the notification email is left to the background executor
+    assert [fn for fn, _ in submitted] == [app_module.notify_contact_submission]
+
+
+def test_admin_inbox_pages_render(admin_client):
+    make_contacts(3)
+
+    assert admin_client.get('/admin').status_code == 200
+    response = admin_client.get('/admin/contacts')
+    assert response.status_code == 200
+    assert b'Student 2' in response.data
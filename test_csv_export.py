@@ -0,0 +1,108 @@
+import csv
+import gzip
+import io
+from datetime import date, time as dt_time
+
+import pytest
+
+from app import app as flask_app, csv_escape_formula, csv_field, stream_csv
+from extensions import db
+from models import InfoSessionBooking, InfoSessionEmail
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('plain', 'plain'),
+    ('', ''),
+    ('a,b', '"a,b"'),
+    ('say "hi"', '"say ""hi"""'),
+    ('two\nlines', '"two\nlines"'),
+    ('+61 400 000 000', '+61 400 000 000'),  # Quoting alone never alters the value
+])
+def test_csv_field(value, expected):
+    assert csv_field(value) == expected
+
+
+def test_csv_field_round_trips_through_csv_reader():
+    values = ['a,b', 'quote " inside', 'multi\r\nline', 'plain']
+    line = ','.join(csv_field(value) for value in values) + '\r\n'
+    assert next(csv.reader(io.StringIO(line, newline=''))) == values
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('plain note', 'plain note'),
+    ('', ''),
+    (None, None),
+    ('=HYPERLINK("http://evil")', '\'=HYPERLINK("http://evil")'),
+    ('+1+cmd', "'+1+cmd"),
+    ('-2+3', "'-2+3"),
+    ('@SUM(A1)', "'@SUM(A1)"),
+    ('\tcmd', "'\tcmd"),
+    ('\rcmd', "'\rcmd"),
+])
+def test_csv_escape_formula(value, expected):
+    assert csv_escape_formula(value) == expected
+
+
+def test_info_session_export(admin_client):
+    db.session.add_all([
+        InfoSessionEmail(email='a@example.com', notes='=cmd|calc', zoom_link_sent=True),
+        InfoSessionEmail(email='b@example.com', notes='Asked about "Xero", MYOB'),
+        InfoSessionEmail(email='c@example.com'),
+    ])
+    db.session.commit()
+
+    response = admin_client.get('/admin/info-sessions/export', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(gzip.decompress(response.data).decode('utf-8'), newline='')))
+
+    assert rows[0] == ['Email', 'Date Registered', 'Confirmation Status', 'Zoom Link Sent', 'Reminder Sent', 'Notes']
+    notes = {row[0]: (row[3], row[5]) for row in rows[1:]}
+    assert notes == {
+        'a@example.com': ('Yes', "'=cmd|calc"),
+        'b@example.com': ('No', 'Asked about "Xero", MYOB'),
+        'c@example.com': ('No', ''),
+    }
+
+
+def test_stream_csv_plain():
+    with flask_app.test_request_context():
+        response = stream_csv('out.csv', ['ID', 'Note'], iter([[1, 'ok, fine'], [-5, '+61 400 000 000']]))
+        body = response.get_data(as_text=True)
+
+    assert response.headers['Content-Disposition'] == 'attachment; filename=out.csv'
+    assert 'Content-Encoding' not in response.headers
+    assert body == 'ID,Note\r\n1,"ok, fine"\r\n-5,+61 400 000 000\r\n'
+
+
+def test_stream_csv_gzip():
+    rows = [[n, f'row {n}'] for n in range(20000)]  # Several CSV_CHUNK_SIZE chunks
+    with flask_app.test_request_context(headers={'Accept-Encoding': 'gzip, deflate'}):
+        response = stream_csv('big.csv', ['ID', 'Name'], iter(rows))
+        compressed = response.get_data()
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    lines = gzip.decompress(compressed).decode('utf-8').split('\r\n')
+    assert lines[0] == 'ID,Name'
+    assert lines[1] == '0,row 0'
+    assert lines[20000] == '19999,row 19999'
+    assert len(lines) == 20002  # Trailing line break
+
+
+def test_bookings_export_escapes_only_free_text(admin_client):
+    db.session.add(InfoSessionBooking(
+        name='Ann', email='ann@example.com', phone='+61 400 000 000',
+        preferred_date=date(2024, 5, 1), preferred_time=dt_time(18, 30),
+        comments='=IMPORTXML("http://evil")', admin_notes='-called back',
+    ))
+    db.session.commit()
+
+    response = admin_client.get('/admin/bookings/export')
+    assert response.status_code == 200
+    header, row = csv.reader(io.StringIO(response.get_data(as_text=True), newline=''))
+
+    booking = dict(zip(header, row))
+    assert booking['Phone'] == '+61 400 000 000'
+    assert booking['Comments'] == '\'=IMPORTXML("http://evil")'
+    assert booking['Admin Notes'] == "'-called back"
+    assert booking['Preferred Time'] == '06:30 PM'
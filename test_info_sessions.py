@@ -0,0 +1,53 @@
+from extensions import db
+from models import InfoSessionEmail
+
+
+def registered_emails():
+    return sorted(db.session.scalars(db.select(InfoSessionEmail.email)))
+
+
+def test_import_requires_login(client):
+    response = client.post('/admin/info-sessions/import', data={'emails': 'a@example.com'})
+    assert response.status_code == 302
+    assert '/admin/login' in response.headers['Location']
+    assert registered_emails() == []
+
+
+def test_import_info_session_emails_skips_duplicates(admin_client):
+    db.session.add(InfoSessionEmail(email='old@example.com'))
+    db.session.commit()
+
+    response = admin_client.post('/admin/info-sessions/import', data={
+        'emails': 'new@example.com, old@example.com\nnew@example.com;other@example.com not-an-email'
+    })
+    assert response.status_code == 302
+    assert registered_emails() == ['new@example.com', 'old@example.com', 'other@example.com']
+
+    with admin_client.session_transaction() as session:
+        assert session['_flashes'][-1] == ('success', '2 emails imported (1 already registered)')
+
+
+def test_delete_requires_login(client):
+    db.session.add(InfoSessionEmail(email='keep@example.com'))
+    db.session.commit()
+
+    for path in ('/admin/info-sessions/delete', '/admin/info-sessions/1/delete'):
+        response = client.post(path, data={'ids': ['1']})
+        assert response.status_code == 302
+        assert '/admin/login' in response.headers['Location']
+    assert registered_emails() == ['keep@example.com']
+
+
+def test_delete_info_session_emails(admin_client):
+    emails = [InfoSessionEmail(email=f'{n}@example.com') for n in range(3)]
+    db.session.add_all(emails)
+    db.session.commit()
+    ids = [email.id for email in emails]
+
+    response = admin_client.post('/admin/info-sessions/delete', data={'ids': [str(ids[0]), str(ids[2]), '9999']})
+    assert response.status_code == 302
+    assert registered_emails() == ['1@example.com']
+
+    assert admin_client.post(f'/admin/info-sessions/{ids[1]}/delete').status_code == 302
+    assert registered_emails() == []
+    assert admin_client.post(f'/admin/info-sessions/{ids[1]}/delete').status_code == 404
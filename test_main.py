@@ -0,0 +1,74 @@
+import importlib
+import sys
+
+from sqlalchemy import inspect
+from werkzeug.security import generate_password_hash
+
+from extensions import db
+from models import Admin
+
+
+def import_main():
+    sys.modules.pop('main', None)
+    return importlib.import_module('main')
+
+
+def table_names():
+    return inspect(db.engine).get_table_names()
+
+
+def test_import_skips_schema_setup_by_default(monkeypatch, app):
+    db.drop_all()
+    monkeypatch.delenv('FACTS_BOOTSTRAP', raising=False)
+
+    import_main()
+
+    assert 'contacts' not in table_names()
+
+
+def test_bootstrap_flag_sets_up_schema(monkeypatch, app):
+    db.drop_all()
+    monkeypatch.setenv('FACTS_BOOTSTRAP', '1')
+    monkeypatch.setenv('ADMIN_BOOTSTRAP_HASH', generate_password_hash('secret'))
+
+    import_main()
+
+    assert 'contacts' in table_names()
+
+
+def test_init_db_command_seeds_admin(monkeypatch, app):
+    db.drop_all()
+    monkeypatch.delenv('FACTS_BOOTSTRAP', raising=False)
+    monkeypatch.setenv('ADMIN_BOOTSTRAP_HASH', generate_password_hash('secret'))
+    main = import_main()
+
+    result = app.test_cli_runner().invoke(main.init_db_command)
+
+    assert result.exit_code == 0, result.output
+    assert 'contacts' in table_names()
+    assert db.session.scalars(db.select(Admin)).one().check_password('secret')
+
+
+def test_init_db_command_fails_without_admin_hash(monkeypatch, app):
+    db.drop_all()
+    monkeypatch.delenv('FACTS_BOOTSTRAP', raising=False)
+    monkeypatch.delenv('ADMIN_BOOTSTRAP_HASH', raising=False)
+    main = import_main()
+
+    result = app.test_cli_runner().invoke(main.init_db_command)
+
+    assert result.exit_code == 1
+    assert 'ADMIN_BOOTSTRAP_HASH is not set' in result.output
+    assert db.session.scalar(db.select(db.func.count(Admin.id))) == 0
+
+
+def test_init_db_command_keeps_existing_admin(monkeypatch, app):
+    monkeypatch.delenv('FACTS_BOOTSTRAP', raising=False)
+    monkeypatch.delenv('ADMIN_BOOTSTRAP_HASH', raising=False)
+    db.session.add(Admin(username='existing', email='existing@example.com', password_hash='x'))
+    db.session.commit()
+    main = import_main()
+
+    result = app.test_cli_runner().invoke(main.init_db_command)
+
+    assert result.exit_code == 0, result.output
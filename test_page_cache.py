@@ -0,0 +1,30 @@
+import app as app_module
+
+
+def test_static_page_cache_ignores_query_string(client):
+    app_module.clear_rendered_pages()
+
+    first = client.get('/about?utm_source=newsletter')
+    second = client.get('/about?utm_source=facebook&fbclid=abc')
+
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert b'utm_source' not in first.data
+    info = app_module._render_page_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_blog_post_cache_ignores_query_string(client):
+    from extensions import db
+    from models import BlogPost
+    db.session.add(BlogPost(title='Xero tips', slug='xero-tips', content='<p>Reconcile daily</p>', is_published=True))
+    db.session.commit()
+    app_module.clear_rendered_pages()
+
+    first = client.get('/blog/xero-tips?utm_source=newsletter')
+    second = client.get('/blog/xero-tips?ref=share')
+
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    info = app_module._render_blog_post_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
@@ -3,17 +3,21 @@ Performance monitoring and optimization utilities
 """
 import time
 import functools
+from collections import deque
 from flask import request, g, current_app
 from datetime import datetime
 
 class PerformanceMonitor:
     """Monitor application performance metrics"""
     
+    # Keep only the most recent entries; deque(maxlen) evicts the oldest in O(1)
+    MAX_ENTRIES = 1000
+    
     def __init__(self):
         self.metrics = {
-            'requests': [],
-            'database_queries': [],
-            'external_api_calls': []
+            'requests': deque(maxlen=self.MAX_ENTRIES),
+            'database_queries': deque(maxlen=self.MAX_ENTRIES),
+            'external_api_calls': deque(maxlen=self.MAX_ENTRIES)
         }
     
     def track_request_time(self, func):
@@ -125,10 +129,6 @@ def init_performance_monitoring(app):
                 'timestamp': datetime.utcnow(),
                 'path': request.path
             })
-            
-            # Keep only recent metrics (last 1000 requests)
-            if len(performance_monitor.metrics['requests']) > 1000:
-                performance_monitor.metrics['requests'] = performance_monitor.metrics['requests'][-1000:]
         
         return response
     